@@ -2,31 +2,124 @@
 
 import yaml
 import os
-from typing import Dict, Any
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, Mapping, Optional, Union
 from pathlib import Path
+from string import Template
+from types import MappingProxyType
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+
+# Prefer the libyaml-backed loader when PyYAML was built with it; same semantics as SafeLoader
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Shared read-only fallback for missing config sections
+_EMPTY_DICT: Mapping[str, Any] = MappingProxyType({})
+
+# Parsed YAML is cached next to the source file as <name>.cache.json
+_CACHE_SUFFIX = '.cache.json'
+
+# Required configuration keys: section -> required child keys, or None for a top-level value
+_SCHEMA = {
+    'anthropic': ['api_key'],
+    'google_drive': ['service_account_file', 'templates_folder_id', 'output_folder_id'],
+    'prompts_file': None,  # Validate prompts file path instead of inline prompts
+}
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple:
+    """Split a dotted configuration key once; get() is called with a small, fixed set of keys"""
+    return tuple(key.split('.'))
+
+
+def _read_only(section: Any) -> Mapping[str, Any]:
+    """Wrap a config section in a zero-copy read-only view"""
+    return MappingProxyType(section) if isinstance(section, dict) else _EMPTY_DICT
+
+
+def _file_signature(path) -> Optional[list]:
+    """Return [mtime_ns, size] for a file, or None if it cannot be stat'ed"""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+_DOTENV_LOADED = False
+
+
+def _ensure_dotenv():
+    """Load .env into the environment once per process rather than per ConfigManager"""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+class _EnvTemplate(Template):
+    """Template that only expands ${VAR_NAME}; bare $VAR and $$ are left untouched"""
+    pattern = r'''
+    \$(?:
+      (?P<escaped>(?!))          |
+      (?P<named>(?!))            |
+      {(?P<braced>[^}]+)}        |
+      (?P<invalid>(?!))
+    )
+    '''
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedConfig:
+    """Validated required settings, resolved once per load for direct attribute access"""
+    anthropic_api_key: str
+    drive_service_account_file: str
+    drive_templates_folder_id: str
+    drive_output_folder_id: str
+    prompts_file: str
+    prompts_path: Path
+
 
 class ConfigManager:
     """Manages configuration loading and validation"""
     
     def __init__(self, config_path: str = "config.yaml"):
         # Load environment variables first
-        load_dotenv()
+        _ensure_dotenv()
         self.config_path = config_path
+        self._prompts_cache: Optional[Dict[str, str]] = None
+        self._prompts_path: Optional[Path] = None
+        self._config_signature: Optional[list] = None
+        self._prompts_signature: Optional[list] = None
+        self._config_has_env_vars = False
         self.config = self._load_config()
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file with environment variable substitution"""
         try:
-            with open(self.config_path, 'r') as file:
-                content = file.read()
-                
-            # Replace environment variables
-            content = self._substitute_env_vars(content)
-            
-            config = yaml.safe_load(content)
+            self._config_has_env_vars = False
+            config = self._read_yaml(self.config_path, substitute_env=True)
             self._validate_config(config)
+            self.resolved = self._build_resolved_config(config)
+            self._cache_sections(config)
+            
+            # Remember what was loaded so reload() can skip unchanged files
+            self._config_signature = _file_signature(self.config_path)
+            self._prompts_signature = _file_signature(self._prompts_path)
             
             return config
         except FileNotFoundError:
@@ -34,41 +127,114 @@ class ConfigManager:
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML configuration: {e}")
     
-    def _substitute_env_vars(self, content: str) -> str:
-        """Replace ${VAR_NAME} with environment variable values"""
-        import re
+    def _read_yaml(self, path, substitute_env: bool = False) -> Any:
+        """Parse a YAML file, reusing its JSON sidecar cache while the file is unchanged"""
+        stat = os.stat(path)
+        signature = [stat.st_mtime_ns, stat.st_size]
+        cache_path = Path(f"{path}{_CACHE_SUFFIX}")
+        
+        try:
+            with open(cache_path, 'rb') as file:
+                cached = _json_loads(file.read())
+            if cached['source'] == signature:
+                return cached['data']
+        except (OSError, ValueError, TypeError, KeyError):
+            pass  # Missing or unreadable cache; parse the YAML
         
-        def replace_env_var(match):
-            var_name = match.group(1)
-            return os.getenv(var_name, match.group(0))  # Return original if not found
+        # Read raw bytes; the YAML loader decodes them itself
+        with open(path, 'rb') as file:
+            content = file.read()
+        
+        if substitute_env and b'${' in content:
+            # Substituted values depend on the environment and may be secrets, so they are never cached
+            self._config_has_env_vars = True
+            return yaml.load(self._substitute_env_vars(content), Loader=_YAML_LOADER)
+        
+        data = yaml.load(content, Loader=_YAML_LOADER)
+        self._write_yaml_cache(cache_path, signature, data)
+        return data
+    
+    @staticmethod
+    def _write_yaml_cache(cache_path: Path, signature: list, data: Any):
+        """Atomically write the JSON sidecar cache; caching is best effort"""
+        try:
+            payload = _json_dumps({'source': signature, 'data': data})
+            # Only cache data that survives a JSON round trip unchanged (no dates, non-string keys, ...)
+            if _json_loads(payload)['data'] != data:
+                return
+            
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(payload)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+    
+    def _substitute_env_vars(self, content: bytes) -> Union[bytes, str]:
+        """Replace ${VAR_NAME} with environment variable values"""
+        # Most configs have no placeholders; return the bytes untouched without decoding
+        if b'${' not in content:
+            return content
         
-        return re.sub(r'\$\{([^}]+)\}', replace_env_var, content)
+        # Snapshot the environment into a plain dict so each lookup skips os.environ's key encoding;
+        # safe_substitute leaves the original placeholder if the variable is not set
+        return _EnvTemplate(content.decode('utf-8')).safe_substitute(dict(os.environ))
     
     def _validate_config(self, config: Dict[str, Any]):
         """Validate required configuration keys"""
-        required_keys = [
-            'anthropic.api_key',
-            'google_drive.service_account_file',
-            'google_drive.templates_folder_id',
-            'google_drive.output_folder_id',
-            'prompts_file'  # Updated to validate prompts file path instead of inline prompts
-        ]
+        # An empty file parses to None; report it as missing keys like any other gap
+        if not isinstance(config, dict):
+            config = {}
         
-        for key in required_keys:
-            if not self._get_nested_value(config, key):
-                raise ValueError(f"Missing required configuration: {key}")
+        for section, keys in _SCHEMA.items():
+            value = config.get(section)
+            if keys is None:
+                if not value:
+                    raise ValueError(f"Missing required configuration: {section}")
+                continue
+            
+            if not isinstance(value, dict):
+                value = {}
+            for key in keys:
+                if not value.get(key):
+                    raise ValueError(f"Missing required configuration: {section}.{key}")
         
-        # Validate that prompts file exists and contains required prompts
-        prompts_file = self._get_nested_value(config, 'prompts_file')
+        # Validate that prompts file exists and contains required prompts;
+        # keep the parsed result so get_prompts() doesn't parse the file again
+        prompts_file = config.get('prompts_file')
         if prompts_file:
-            self._validate_prompts_file(prompts_file)
+            self._prompts_path = self._resolve_prompts_path(prompts_file)
+            self._prompts_cache = self._validate_prompts_file(self._prompts_path)
+    
+    def _build_resolved_config(self, config: Dict[str, Any]) -> ResolvedConfig:
+        """Copy the validated required keys into a ResolvedConfig"""
+        drive_config = config['google_drive']
+        return ResolvedConfig(
+            anthropic_api_key=config['anthropic']['api_key'],
+            drive_service_account_file=drive_config['service_account_file'],
+            drive_templates_folder_id=drive_config['templates_folder_id'],
+            drive_output_folder_id=drive_config['output_folder_id'],
+            prompts_file=config['prompts_file'],
+            prompts_path=self._prompts_path,
+        )
+    
+    def _cache_sections(self, config: Dict[str, Any]):
+        """Look up the top-level sections once, as read-only views so callers can't mutate the cache"""
+        self._anthropic = _read_only(config.get('anthropic'))
+        self._drive = _read_only(config.get('google_drive'))
+        self._baseline_resumes = _read_only(self._drive.get('baseline_resumes'))
+        self._file_organization = _read_only(config.get('file_organization'))
+        self._system = _read_only(config.get('system'))
     
     def _get_nested_value(self, config: Dict[str, Any], key: str) -> Any:
         """Get nested configuration value using dot notation"""
-        keys = key.split('.')
         value = config
         
-        for k in keys:
+        for k in _split_key(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -81,54 +247,55 @@ class ConfigManager:
         value = self._get_nested_value(self.config, key)
         return value if value is not None else default
     
-    def get_anthropic_config(self) -> Dict[str, Any]:
+    def get_anthropic_config(self) -> Mapping[str, Any]:
         """Get Anthropic API configuration"""
-        return self.config.get('anthropic', {})
+        return self._anthropic
     
-    def get_drive_config(self) -> Dict[str, Any]:
+    def get_drive_config(self) -> Mapping[str, Any]:
         """Get Google Drive configuration"""
-        return self.config.get('google_drive', {})
+        return self._drive
     
-    def _validate_prompts_file(self, prompts_file: str):
-        """Validate that prompts file exists and contains required prompts"""
+    def _resolve_prompts_path(self, prompts_file: str) -> Path:
+        """Resolve the prompts file path once per config load"""
         prompts_path = Path(prompts_file)
         if not prompts_path.is_absolute():
             # If relative path, make it relative to config file directory
             config_dir = Path(self.config_path).parent
             prompts_path = config_dir / prompts_file
-        
+        return prompts_path
+    
+    def _validate_prompts_file(self, prompts_path: Path) -> Dict[str, str]:
+        """Validate that prompts file exists and contains required prompts, returning the parsed prompts"""
         if not prompts_path.exists():
             raise FileNotFoundError(f"Prompts file not found: {prompts_path}")
         
         try:
-            with open(prompts_path, 'r', encoding='utf-8') as file:
-                prompts_config = yaml.safe_load(file)
+            prompts_config = self._read_yaml(prompts_path)
             
             # Validate required prompts exist
             required_prompts = ['prompt_1', 'prompt_2', 'prompt_3']
             for prompt_name in required_prompts:
                 if prompt_name not in prompts_config:
                     raise ValueError(f"Missing required prompt '{prompt_name}' in prompts file: {prompts_path}")
+            
+            return prompts_config
         
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in prompts file {prompts_path}: {e}")
     
     def _load_prompts_from_file(self) -> Dict[str, str]:
-        """Load prompts from external YAML file"""
-        prompts_file = self.config.get('prompts_file')
-        if not prompts_file:
-            return {}
+        """Load prompts from external YAML file (parsed once, cached until reload)"""
+        if self._prompts_cache is not None:
+            return self._prompts_cache
         
-        prompts_path = Path(prompts_file)
-        if not prompts_path.is_absolute():
-            # If relative path, make it relative to config file directory
-            config_dir = Path(self.config_path).parent
-            prompts_path = config_dir / prompts_file
+        prompts_path = self._prompts_path
+        if prompts_path is None:
+            return {}
         
         try:
-            with open(prompts_path, 'r', encoding='utf-8') as file:
-                prompts_config = yaml.safe_load(file)
-            return prompts_config or {}
+            prompts_config = self._read_yaml(prompts_path)
+            self._prompts_cache = prompts_config or {}
+            return self._prompts_cache
         except Exception as e:
             print(f"Error loading prompts from {prompts_path}: {e}")
             return {}
@@ -142,31 +309,41 @@ class ConfigManager:
         prompts = self._load_prompts_from_file()
         return prompts.get(prompt_name, '')
     
-    def get_file_organization_config(self) -> Dict[str, Any]:
+    def get_file_organization_config(self) -> Mapping[str, Any]:
         """Get file organization settings"""
-        return self.config.get('file_organization', {})
+        return self._file_organization
     
-    def get_system_config(self) -> Dict[str, Any]:
+    def get_system_config(self) -> Mapping[str, Any]:
         """Get system settings"""
-        return self.config.get('system', {})
+        return self._system
     
-    def get_baseline_resume_mapping(self) -> Dict[str, str]:
+    def get_baseline_resume_mapping(self) -> Mapping[str, str]:
         """Get baseline resume name to file mapping"""
-        return self.config.get('google_drive', {}).get('baseline_resumes', {})
+        return self._baseline_resumes
     
-    def get_template_mapping(self) -> Dict[str, str]:
+    def get_template_mapping(self) -> Mapping[str, str]:
         """Get baseline resume mapping (legacy method name for backward compatibility)"""
-        return self.get_baseline_resume_mapping()
+        return self._baseline_resumes
     
     def reload(self):
-        """Reload configuration from file"""
-        self.config = self._load_config()
+        """Reload configuration from file, skipping files that have not changed"""
+        # ${VAR} values come from the environment, which may have changed even if the file has not
+        if self._config_has_env_vars or _file_signature(self.config_path) != self._config_signature:
+            self._prompts_cache = None
+            self.config = self._load_config()
+        elif _file_signature(self._prompts_path) != self._prompts_signature:
+            # Only the prompts changed; re-validate them without re-reading the config
+            self._prompts_cache = self._validate_prompts_file(self._prompts_path)
+            self._prompts_signature = _file_signature(self._prompts_path)
 
 
-# Global configuration instance
-config = ConfigManager()
+# Global configuration instance, created on first access by get_config()
+config: Optional[ConfigManager] = None
 
 
 def get_config() -> ConfigManager:
-    """Get the global configuration instance"""
+    """Get the global configuration instance, loading it on first use"""
+    global config
+    if config is None:
+        config = ConfigManager()
     return config
\ No newline at end of file
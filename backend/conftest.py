@@ -3,5 +3,7 @@
 import sys
 from pathlib import Path
 
-# Add the backend directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add the backend directory to the Python path (once, even if conftest is re-imported)
+_BACKEND_DIR = str(Path(__file__).resolve().parent)
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
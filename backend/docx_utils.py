@@ -5,12 +5,56 @@ from docxtpl import DocxTemplate
 from docx.oxml import OxmlElement, ns
 from docx.oxml.ns import qn
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import io
+import json
 import logging
+import os
+import re
 
 # Create logger for this module
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for parsing Claude responses
+_JSON_BLOCK_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+_DOUBLE_BRACE_TAG_RE = re.compile(r'\{\{(\w+)\}\}\s*\n(.*?)(?=\{\{\w+\}\}|\Z)', re.DOTALL)
+_SINGLE_BRACE_TAG_RE = re.compile(r'\{(\w+)\}\s*\n(.*?)(?=\{\w+\}|\Z)', re.DOTALL)
+
+# Interview prep sections and their numbered "N. Header\nContent" items
+_COMPANY_RE = re.compile(r'COMPANY:\s*\n(.*?)(?=\n[A-Z_]+:|$)', re.DOTALL)
+_JOB_TITLE_RE = re.compile(r'JOB_TITLE:\s*\n(.*?)(?=\n[A-Z_]+:|$)', re.DOTALL)
+_CORE_NARRATIVE_RE = re.compile(r'CORE_NARRATIVE:\s*\n(.*?)(?=\n[A-Z_]+:|$)', re.DOTALL)
+_PROOF_POINTS_RE = re.compile(r'PROOF_POINTS:\s*\n(.*?)(?=\nPOTENTIAL_CONCERNS:|$)', re.DOTALL)
+_CONCERNS_RE = re.compile(r'POTENTIAL_CONCERNS:\s*\n(.*?)(?=\nCULTURAL_ALIGNMENT:|$)', re.DOTALL)
+_CULTURE_RE = re.compile(r'CULTURAL_ALIGNMENT:\s*\n(.*?)(?=\nSTRATEGIC_QUESTIONS:|$)', re.DOTALL)
+_QUESTIONS_RE = re.compile(r'STRATEGIC_QUESTIONS:\s*\n(.*?)(?=\nCLOSING_POSITIONING:|$)', re.DOTALL)
+_CLOSING_RE = re.compile(r'CLOSING_POSITIONING:\s*\n(.*?)$', re.DOTALL)
+_ITEM_RE = re.compile(r'\d+\.\s+(?P<header>[^\n]+)\n(?P<content>.*?)(?=\d+\.|$)', re.DOTALL)
+_QUESTION_RE = re.compile(r'\d+\.\s*(.+?)(?=\n\d+\.|$)', re.DOTALL)
+
+# Resume experience lines: next-company headers and employment years (2018-2029)
+_COMPANY_HEADER_RE = re.compile(r'(?:ROOT|SURE|ENLACE|MANTA)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'20(?:1[89]|2\d)')
+_NUM_PREFIX_RE = re.compile(r'^\d+\.\s*')
+
+# Start of the line that ends a company's achievements: the next company header or a non-bullet Education line
+_NEXT_SECTION_RE = re.compile(r'^[ \t]*(?:(?i:ROOT|SURE|ENLACE|MANTA)|(?![•-])[^\n]*Education)', re.MULTILINE)
+
+# Line prefixes that mark a bulleted item; str.startswith takes the tuple in one call
+_BULLET_PREFIXES = ('•', '-')
+
+# Skill category headings contain '&' or one of these keywords
+_SKILL_HEADING_KEYWORD_RE = re.compile(r'&|LEADERSHIP|MANAGEMENT|ENGINEERING|ARCHITECTURE|TECHNICAL|BUSINESS')
+
+# Contact details that mark the end of the resume header in the fallback headline search
+_CONTACT_INDICATOR_RE = re.compile(r'jerry mindek|@gmail\.com|columbus, oh', re.IGNORECASE)
+
+# Section headers in new content that aren't all caps: "Title Case Words" or anything ending in a colon
+_CONTENT_HEADER_RE = re.compile(r'[A-Z][A-Za-z\s&-]+|.*:')
+
 
 # Note: To get hyperlinks like in the baseline resume, you need to manually update 
 # the template file to have hyperlinks instead of plain text template tags.
@@ -39,18 +83,21 @@ def read_docx_content(file_path: Path) -> str:
         # Try to read with python-docx directly, which is more forgiving than zipfile validation
         doc = Document(file_path)
         
+        # Work on the body XML directly instead of building Paragraph/Table/Cell proxies
+        body = doc.element.body
+        
         # Extract all text from paragraphs
         content = []
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():  # Skip empty paragraphs
-                content.append(paragraph.text)
+        for p in body.iterchildren(qn('w:p')):
+            text = p.text
+            if text.strip():  # Skip empty paragraphs
+                content.append(text)
         
-        # Extract text from tables if any
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    if cell.text.strip():
-                        content.append(cell.text)
+        # Extract text from tables if any (each <w:tc> once, so merged cells aren't repeated)
+        for tc in body.xpath('./w:tbl/w:tr/w:tc'):
+            text = '\n'.join(p.text for p in tc.iterchildren(qn('w:p')))
+            if text.strip():
+                content.append(text)
         
         return '\n'.join(content)
         
@@ -72,24 +119,7 @@ def write_docx_content(file_path: Path, content: str, preserve_formatting: bool
     """
     try:
         doc = Document()
-        
-        # Split content into paragraphs
-        paragraphs = content.split('\n')
-        
-        for paragraph_text in paragraphs:
-            paragraph_text = paragraph_text.strip()
-            if paragraph_text:  # Skip empty lines
-                # Check if this looks like a heading (all caps, short lines, etc.)
-                if (paragraph_text.isupper() and len(paragraph_text) < 50) or \
-                   paragraph_text.endswith(':') and len(paragraph_text) < 50:
-                    # Add as heading
-                    doc.add_heading(paragraph_text, level=1)
-                else:
-                    # Add as regular paragraph
-                    doc.add_paragraph(paragraph_text)
-            else:
-                # Add empty paragraph for spacing
-                doc.add_paragraph()
+        _append_content_paragraphs(doc, content)
         
         # Save the document
         doc.save(str(file_path))
@@ -100,6 +130,39 @@ def write_docx_content(file_path: Path, content: str, preserve_formatting: bool
         return False
 
 
+def _append_content_paragraphs(doc, content: str) -> None:
+    """Append one paragraph per line of content to doc, styling heading-like lines as 'Heading 1'"""
+    # Split content into paragraphs
+    paragraphs = content.split('\n')
+    
+    # Insert every paragraph before a single leader paragraph. doc.add_paragraph()
+    # searches the body for the section properties on each call, which is O(n^2) overall.
+    leader = doc.add_paragraph()
+    try:
+        heading_style = doc.styles['Heading 1']
+    except KeyError:
+        heading_style = None  # Template without a Heading 1 style; keep headings as plain paragraphs
+    
+    for paragraph_text in paragraphs:
+        paragraph_text = paragraph_text.strip()
+        if paragraph_text:  # Skip empty lines
+            # Check if this looks like a heading (short, and all caps or ending in a colon);
+            # the length test comes first so long prose lines skip the isupper() scan
+            is_heading = len(paragraph_text) < 50 and (paragraph_text.endswith(':') or paragraph_text.isupper())
+            if is_heading:
+                # Add as heading
+                leader.insert_paragraph_before(paragraph_text, style=heading_style)
+            else:
+                # Add as regular paragraph
+                leader.insert_paragraph_before(paragraph_text)
+        else:
+            # Add empty paragraph for spacing
+            leader.insert_paragraph_before()
+    
+    # Drop the leader now that all content sits before it
+    leader._element.getparent().remove(leader._element)
+
+
 def copy_docx_with_new_content(source_path: Path, dest_path: Path, new_content: str) -> bool:
     """
     Copy a .docx file and replace ONLY the text content while preserving ALL formatting.
@@ -118,25 +181,26 @@ def copy_docx_with_new_content(source_path: Path, dest_path: Path, new_content:
         source_doc = Document(source_path)
         
         # Split new content into lines
-        new_lines = [line.strip() for line in new_content.split('\n') if line.strip()]
-        
-        # Get all existing paragraphs
-        existing_paragraphs = source_doc.paragraphs[:]
+        new_lines = tuple(line.strip() for line in new_content.split('\n') if line.strip())
+        line_count = len(new_lines)
         
         # Strategy: Replace text content in existing paragraphs while preserving formatting
         line_index = 0
         
-        for paragraph in existing_paragraphs:
-            if line_index < len(new_lines):
+        for paragraph in source_doc.paragraphs:
+            if line_index < line_count:
                 # Clear existing text but keep paragraph formatting
                 paragraph.clear()
                 
                 # Add new text with preserved formatting
-                run = paragraph.add_run(new_lines[line_index])
+                paragraph.add_run(new_lines[line_index])
                 line_index += 1
-            else:
-                # If we have more paragraphs than content lines, clear the extras
+            elif paragraph._p.pPr is not None and paragraph._p.pPr.sectPr is not None:
+                # Section breaks live in the paragraph properties; keep the paragraph, just empty it
                 paragraph.clear()
+            else:
+                # If we have more paragraphs than content lines, detach the extras in one step
+                paragraph._element.getparent().remove(paragraph._element)
         
         # If we have more content lines than paragraphs, add them as new paragraphs
         while line_index < len(new_lines):
@@ -153,6 +217,12 @@ def copy_docx_with_new_content(source_path: Path, dest_path: Path, new_content:
         return False
 
 
+@lru_cache(maxsize=16)
+def _load_template_bytes(path_str: str, mtime_ns: int) -> bytes:
+    """Read a template file once per (path, mtime); each render opens its own DocxTemplate over the bytes"""
+    with open(path_str, 'rb') as template_file:
+        return template_file.read()
+
 
 def tag_based_template_replacement(template_path: Path, dest_path: Path, tag_values: Dict[str, Any]) -> bool:
     """
@@ -171,8 +241,9 @@ def tag_based_template_replacement(template_path: Path, dest_path: Path, tag_val
         # Map tag values to match template tag names
         mapped_values = map_tag_values_to_template(tag_values, template_path)
         
-        # Load the template
-        template = DocxTemplate(template_path)
+        # Load the template from the cached file bytes; each render gets a fresh document to fill
+        template_bytes = _load_template_bytes(str(template_path), os.stat(template_path).st_mtime_ns)
+        template = DocxTemplate(io.BytesIO(template_bytes))
         
         # Replace tags with values
         template.render(mapped_values)
@@ -192,15 +263,76 @@ def tag_based_template_replacement(template_path: Path, dest_path: Path, tag_val
         return False
 
 
+def _render_one(job: Tuple[Path, Path, Dict[str, Any]]) -> bool:
+    """Process pool worker: render a single (template_path, dest_path, tag_values) job"""
+    template_path, dest_path, tag_values = job
+    return tag_based_template_replacement(template_path, dest_path, tag_values)
+
+
+def render_many(jobs: List[Tuple[Path, Path, Dict[str, Any]]]) -> List[bool]:
+    """
+    Render a batch of templates in parallel with tag_based_template_replacement.
+    
+    Each render is an independent, CPU-bound docx load + Jinja render + save, so the
+    batch is spread across a process pool rather than threads.
+    
+    Args:
+        jobs: List of (template_path, dest_path, tag_values) tuples
+        
+    Returns:
+        List of per-job success flags, in the same order as jobs
+    """
+    if len(jobs) <= 1:
+        # Not worth starting a pool for a single render
+        return [_render_one(job) for job in jobs]
+    
+    max_workers = min(os.cpu_count() or 1, len(jobs))
+    # Batch several jobs per task for large batches, but keep small batches spread across all workers
+    chunksize = max(1, len(jobs) // (max_workers * 4))
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_render_one, jobs, chunksize=chunksize))
+
+
+@lru_cache(maxsize=32)
+def _template_link_tags(path_str: str, mtime_ns: int) -> frozenset:
+    """Social-link tags present in a template, read once per (path, mtime)"""
+    template_content = read_docx_content(Path(path_str))
+    return frozenset(tag for tag in ('linkedin', 'otherlink1', 'otherlink2') if f'{{{{{tag}}}}}' in template_content)
+
+
+# Shared, read-only default for a company with no experience data
+_EMPTY_JOB = MappingProxyType({'description': '', 'achievements': ()})
+
+# Resume template tags filled straight from tag_values: (template tag, source keys in priority order, default)
+_RESUME_TAG_SOURCES = (
+    ('jobtitle', ('role', 'jobtitle'), 'Engineering Manager'),
+    ('title', ('role', 'jobtitle'), 'Engineering Manager'),  # Alternative name
+    ('key_achievements', ('key_achievements',), ''),  # Legacy
+    ('key_achievements_list', ('key_achievements_list',), ()),  # NEW: For Jinja loops
+    ('leadership_philosophy', ('headline', 'leadership_philosophy'), ''),
+    ('professional_summary', ('headline', 'professional_summary'), ''),
+    ('headline', ('headline',), ''),  # Direct mapping for new format
+    # NEW: Structured skill categories for Jinja loops
+    ('skill_categories', ('skill_categories',), ()),
+    # NEW: Structured job experience objects for Jinja loops - using company1, company2, etc.
+    ('company1', ('sure', 'company1'), _EMPTY_JOB),
+    ('company2', ('root', 'company2'), _EMPTY_JOB),
+    ('company3', ('enlace', 'company3'), _EMPTY_JOB),
+    ('company4', ('manta', 'company4'), _EMPTY_JOB),
+    # Legacy skill tags for backward compatibility
+    ('skill_heading', ('skill_heading',), ''),
+    ('skills', ('skills',), ''),
+    ('education', ('education',), ''),
+)
+
+
 def map_tag_values_to_template(tag_values: Dict[str, Any], template_path: Path) -> Dict[str, Any]:
     """
     Map JSON tag values to actual template tag names.
     Handles discrepancies between Claude's JSON keys and template tags.
     """
     try:
-        # Read template to see what tags it actually contains
-        template_content = read_docx_content(template_path)
-        
         # Create mapping based on template file name and content
         mapped_values = {}
         
@@ -208,7 +340,8 @@ def map_tag_values_to_template(tag_values: Dict[str, Any], template_path: Path)
         if ("Manager" in template_path.name or "Engineer" in template_path.name) and "Interview Prep" not in template_path.name and "Cover Letter" not in template_path.name:
             # Resume template mappings
             # Get personal info and company experience from config
-            from backend.config_manager import config
+            from backend.config_manager import get_config
+            config = get_config()
             personal_info = config.get('personal_info', {})
             company_experience = config.get('company_experience', {})
             
@@ -228,22 +361,22 @@ def map_tag_values_to_template(tag_values: Dict[str, Any], template_path: Path)
                 logger.debug(f"Added company template variables for {company_key}: {list(company_data.keys())}")
             
             # Social links - only replace if template tags exist, otherwise skip
-            template_content = read_docx_content(template_path)
-            if '{{linkedin}}' in template_content:
+            link_tags = _template_link_tags(str(template_path), os.stat(template_path).st_mtime_ns)
+            if 'linkedin' in link_tags:
                 mapped_values['linkedin'] = tag_values.get('linkedin', 'LinkedIn')
-            if '{{otherlink1}}' in template_content:
+            if 'otherlink1' in link_tags:
                 mapped_values['otherlink1'] = tag_values.get('otherlink1', 'Github')  
-            if '{{otherlink2}}' in template_content:
+            if 'otherlink2' in link_tags:
                 mapped_values['otherlink2'] = tag_values.get('otherlink2', 'Substack')
             
-            # Handle new template tag format from prompt_1_template
-            mapped_values['jobtitle'] = tag_values.get('role', tag_values.get('jobtitle', 'Engineering Manager'))
-            mapped_values['title'] = tag_values.get('role', tag_values.get('jobtitle', 'Engineering Manager'))  # Alternative name
-            mapped_values['key_achievements'] = tag_values.get('key_achievements', '')  # Legacy
-            mapped_values['key_achievements_list'] = tag_values.get('key_achievements_list', [])  # NEW: For Jinja loops
-            mapped_values['leadership_philosophy'] = tag_values.get('headline', tag_values.get('leadership_philosophy', ''))
-            mapped_values['professional_summary'] = tag_values.get('headline', tag_values.get('professional_summary', ''))
-            mapped_values['headline'] = tag_values.get('headline', '')  # Direct mapping for new format
+            # Handle new template tag format from prompt_1_template: first source key present wins
+            for template_tag, source_keys, default in _RESUME_TAG_SOURCES:
+                for source_key in source_keys:
+                    if source_key in tag_values:
+                        mapped_values[template_tag] = tag_values[source_key]
+                        break
+                else:
+                    mapped_values[template_tag] = default
             
             # Handle skills_section from new template format
             skills_content = tag_values.get('skills_section', '')
@@ -258,7 +391,7 @@ def map_tag_values_to_template(tag_values: Dict[str, Any], template_path: Path)
                     if not line:
                         continue
                     # Check if this is a category header (no bullets)
-                    if not line.startswith('•') and not line.startswith('-') and line.isupper():
+                    if not line.startswith(_BULLET_PREFIXES) and line.isupper():
                         # Save previous category if exists
                         if current_category and current_skills:
                             if 'LEADERSHIP' in current_category:
@@ -293,21 +426,6 @@ def map_tag_values_to_template(tag_values: Dict[str, Any], template_path: Path)
                 mapped_values['engineering_heading'] = tag_values.get('engineering_heading', 'ENGINEERING & ARCHITECTURE') 
                 mapped_values['engineering_skills'] = tag_values.get('engineering_skills', '')
             
-            # NEW: Structured skill categories for Jinja loops
-            mapped_values['skill_categories'] = tag_values.get('skill_categories', [])
-            
-            # NEW: Structured job experience objects for Jinja loops - using company1, company2, etc.
-            mapped_values['company1'] = tag_values.get('sure', tag_values.get('company1', {'description': '', 'achievements': []}))
-            mapped_values['company2'] = tag_values.get('root', tag_values.get('company2', {'description': '', 'achievements': []}))
-            mapped_values['company3'] = tag_values.get('enlace', tag_values.get('company3', {'description': '', 'achievements': []}))
-            mapped_values['company4'] = tag_values.get('manta', tag_values.get('company4', {'description': '', 'achievements': []}))
-            
-            # Legacy skill tags for backward compatibility
-            mapped_values['skill_heading'] = tag_values.get('skill_heading', '')
-            mapped_values['skills'] = tag_values.get('skills', '')
-            
-            mapped_values['education'] = tag_values.get('education', '')
-            
             # Handle new experience_* template tags and map to company1, company2, etc.
             _map_experience_tag(tag_values, mapped_values, 'experience_sure', 'company1')
             _map_experience_tag(tag_values, mapped_values, 'experience_root', 'company2') 
@@ -320,12 +438,12 @@ def map_tag_values_to_template(tag_values: Dict[str, Any], template_path: Path)
                 achievements_list = []
                 for line in achievements_content.split('\n'):
                     line = line.strip()
-                    if line and (line[0].isdigit() or line.startswith('•') or line.startswith('-')):
+                    if line and (line[0].isdigit() or line.startswith(_BULLET_PREFIXES)):
                         # Remove numbering and bullet points
                         clean_line = line
                         if line[0].isdigit():
                             clean_line = '. '.join(line.split('. ')[1:])  # Remove "1. " prefix
-                        elif line.startswith('•') or line.startswith('-'):
+                        elif line.startswith(_BULLET_PREFIXES):
                             clean_line = line[1:].strip()  # Remove bullet
                         if clean_line:
                             achievements_list.append(clean_line)
@@ -345,7 +463,7 @@ def map_tag_values_to_template(tag_values: Dict[str, Any], template_path: Path)
                         continue
                     
                     # Check if this line is a heading (all caps, no bullets)
-                    if line.isupper() and not line.startswith('•') and not line.startswith('-'):
+                    if line.isupper() and not line.startswith(_BULLET_PREFIXES):
                         # Save previous category
                         if current_heading and current_skills:
                             skill_categories.append({
@@ -380,7 +498,8 @@ def map_tag_values_to_template(tag_values: Dict[str, Any], template_path: Path)
         elif "Cover Letter" in template_path.name:
             # Cover letter template mappings
             # Get personal info from config
-            from backend.config_manager import config
+            from backend.config_manager import get_config
+            config = get_config()
             personal_info = config.get('personal_info', {})
             
             mapped_values['company'] = tag_values.get('company', '')
@@ -473,12 +592,12 @@ def map_tag_values_to_template(tag_values: Dict[str, Any], template_path: Path)
                 
                 for line in questions_content.split('\n'):
                     line = line.strip()
-                    if line and (line[0].isdigit() or line.startswith('•') or line.startswith('-')):
+                    if line and (line[0].isdigit() or line.startswith(_BULLET_PREFIXES)):
                         # Remove numbering and bullets
                         clean_line = line
                         if line[0].isdigit():
                             clean_line = '. '.join(line.split('. ')[1:])  # Remove "1. " prefix
-                        elif line.startswith('•') or line.startswith('-'):
+                        elif line.startswith(_BULLET_PREFIXES):
                             clean_line = line[1:].strip()  # Remove bullet
                         if clean_line:
                             questions_list.append(clean_line)
@@ -503,15 +622,12 @@ def parse_claude_response_for_tags(claude_response: str, baseline_content: str)
     Simple approach: Just extract basic sections from Claude's response for template tags.
     """
     try:
-        import json
-        import re
-        
         # First try JSON (for legacy cover letters)
-        json_match = re.search(r'```json\s*(\{.*?\})\s*```', claude_response, re.DOTALL)
+        json_match = _JSON_BLOCK_RE.search(claude_response)
         if json_match:
             try:
                 tag_values = json.loads(json_match.group(1))
-                print(f"Successfully parsed JSON with {len(tag_values)} tags")
+                logger.info("Successfully parsed JSON with %d tags", len(tag_values))
                 return tag_values
             except json.JSONDecodeError:
                 pass
@@ -523,16 +639,17 @@ def parse_claude_response_for_tags(claude_response: str, baseline_content: str)
             baseline_tags = extract_template_tags(baseline_content)
             if baseline_tags:
                 template_tags.update(baseline_tags)
-                print(f"Merged {len(baseline_tags)} baseline tags with {len(template_tags) - len(baseline_tags)} template tags")
+                logger.debug("Merged %d baseline tags with %d template tags", len(baseline_tags), len(template_tags) - len(baseline_tags))
             
-            print(f"Successfully parsed template tags with {len(template_tags)} tags")
+            logger.info("Successfully parsed template tags with %d tags", len(template_tags))
             return template_tags
         
         # For resume: Just use Claude's response directly in key sections
-        print("Using Claude's formatted response for template population")
+        logger.debug("Using Claude's formatted response for template population")
         
-        # Simple extraction - just grab obvious sections
-        skills_section = extract_section(claude_response, 'Skills', 'Professional Experience')
+        # Simple extraction - just grab obvious sections; marker positions are shared across lookups
+        sections = _section_index(claude_response)
+        skills_section = sections.extract('Skills', 'Professional Experience')
         skill_categories_list = extract_skill_categories_for_jinja(skills_section)
         skill_categories_dict = extract_individual_skill_categories(skills_section)
         
@@ -553,10 +670,10 @@ def parse_claude_response_for_tags(claude_response: str, baseline_content: str)
         possible_headlines = ['Leadership Philosophy', 'Professional Summary', 'Executive Summary', 'Summary']
         
         for headline in possible_headlines:
-            content = extract_section(claude_response, headline, 'Key Achievements')
+            content = sections.extract(headline, 'Key Achievements')
             if content:
                 headline_content = content
-                print(f"Found headline content in '{headline}' section")
+                logger.debug("Found headline content in '%s' section", headline)
                 break
         
         # If no specific section found, use the content after contact info but before Key Achievements
@@ -572,7 +689,7 @@ def parse_claude_response_for_tags(claude_response: str, baseline_content: str)
                     continue
                     
                 # Start collecting after we see contact info or header
-                if any(indicator in line.lower() for indicator in ['jerry mindek', '@gmail.com', 'columbus, oh']):
+                if _CONTACT_INDICATOR_RE.search(line):
                     collecting = True
                     continue
                     
@@ -587,7 +704,7 @@ def parse_claude_response_for_tags(claude_response: str, baseline_content: str)
                     
             if content_lines:
                 headline_content = '\n'.join(content_lines)
-                print("Extracted headline content from first section after contact info")
+                logger.debug("Extracted headline content from first section after contact info")
         
         tag_values = {
             # Personal information tokens for generic templates
@@ -600,12 +717,12 @@ def parse_claude_response_for_tags(claude_response: str, baseline_content: str)
             'otherlink2': personal_info.get('otherlink2', 'Portfolio'),
             
             'jobtitle': 'Engineering Manager',
-            'key_achievements': extract_section(claude_response, 'Key Achievements', 'Skills'),  # Legacy
+            'key_achievements': sections.extract('Key Achievements', 'Skills'),  # Legacy
             'key_achievements_list': key_achievements_list,  # NEW: Structured list for Jinja loops
             'headline': headline_content,  # Single tag for first section content (Leadership Philosophy or Professional Summary)
             'professional_summary': headline_content,   # Same content for backward compatibility
             'skill_categories': skill_categories_list,  # Structured list for Jinja loops
-            'education': extract_section(claude_response, 'Education', ''),
+            'education': sections.extract('Education', ''),
             
             # NEW: Structured job experience objects for Jinja loops - using company1, company2, etc.
             'company1': company1_job,
@@ -619,11 +736,12 @@ def parse_claude_response_for_tags(claude_response: str, baseline_content: str)
         # Add individual skill category tags for backward compatibility
         tag_values.update(skill_categories_dict)
         
-        print(f"Extracted {len([v for v in tag_values.values() if v])} populated tags")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted %d populated tags", sum(1 for v in tag_values.values() if v))
         return tag_values
         
     except Exception as e:
-        print(f"Error parsing Claude response: {str(e)}")
+        logger.error("Error parsing Claude response: %s", e)
         return {}
 
 
@@ -634,15 +752,13 @@ def extract_template_tags(claude_response: str) -> Dict[str, str]:
     [tag content]
     """
     try:
-        import re
         tag_values = {}
         
         # Try double braces first (preferred format)
-        double_brace_pattern = r'\{\{(\w+)\}\}\s*\n(.*?)(?=\{\{\w+\}\}|\Z)'
-        matches = re.findall(double_brace_pattern, claude_response, re.DOTALL)
+        matches = _DOUBLE_BRACE_TAG_RE.findall(claude_response)
         
         if matches:
-            logger.debug(f"Found {len(matches)} double-brace template tags")
+            logger.debug("Found %d double-brace template tags", len(matches))
             for tag_name, tag_content in matches:
                 # Clean up the content (remove brackets if present, strip whitespace)
                 cleaned_content = tag_content.strip()
@@ -652,11 +768,10 @@ def extract_template_tags(claude_response: str) -> Dict[str, str]:
                 tag_values[tag_name] = cleaned_content
         else:
             # Fallback to single braces if no double braces found (LEGACY SUPPORT - should be phased out)
-            single_brace_pattern = r'\{(\w+)\}\s*\n(.*?)(?=\{\w+\}|\Z)'
-            matches = re.findall(single_brace_pattern, claude_response, re.DOTALL)
+            matches = _SINGLE_BRACE_TAG_RE.findall(claude_response)
             
             if matches:
-                print(f"WARNING: Found {len(matches)} single-brace template tags (legacy format - please update prompts to use double braces)")
+                logger.warning("Found %d single-brace template tags (legacy format - please update prompts to use double braces)", len(matches))
                 for tag_name, tag_content in matches:
                     # Clean up the content (remove brackets if present, strip whitespace)
                     cleaned_content = tag_content.strip()
@@ -665,93 +780,72 @@ def extract_template_tags(claude_response: str) -> Dict[str, str]:
                         cleaned_content = cleaned_content[1:-1].strip()
                     tag_values[tag_name] = cleaned_content
             else:
-                print("DEBUG: No template tags found in Claude response")
+                logger.debug("No template tags found in Claude response")
         
         return tag_values
         
     except Exception as e:
-        print(f"Error extracting template tags: {str(e)}")
+        logger.error("Error extracting template tags: %s", e)
         return {}
 
 
+def _parse_numbered_items(section_text: str) -> list:
+    """Split an interview prep section into [{'header': ..., 'content': ...}] items in one pass"""
+    return [
+        {'header': m.group('header').strip(), 'content': m.group('content').strip()}
+        for m in _ITEM_RE.finditer(section_text)
+    ]
+
+
 def parse_interview_prep_response(claude_response: str) -> Dict[str, Any]:
     """Parse Claude's interview prep response into template tags"""
     try:
-        import re
-        
         tag_values = {}
         
         # Extract company and job title
-        company_match = re.search(r'COMPANY:\s*\n(.*?)(?=\n[A-Z_]+:|$)', claude_response, re.DOTALL)
+        company_match = _COMPANY_RE.search(claude_response)
         if company_match:
             tag_values['company'] = company_match.group(1).strip()
         
-        job_title_match = re.search(r'JOB_TITLE:\s*\n(.*?)(?=\n[A-Z_]+:|$)', claude_response, re.DOTALL)
+        job_title_match = _JOB_TITLE_RE.search(claude_response)
         if job_title_match:
             tag_values['jobtitle'] = job_title_match.group(1).strip()
         
         # Extract core narrative
-        core_match = re.search(r'CORE_NARRATIVE:\s*\n(.*?)(?=\n[A-Z_]+:|$)', claude_response, re.DOTALL)
+        core_match = _CORE_NARRATIVE_RE.search(claude_response)
         if core_match:
             tag_values['core_narrative'] = core_match.group(1).strip()
         
         # Extract proof points
-        proof_section = re.search(r'PROOF_POINTS:\s*\n(.*?)(?=\nPOTENTIAL_CONCERNS:|$)', claude_response, re.DOTALL)
+        proof_section = _PROOF_POINTS_RE.search(claude_response)
         if proof_section:
             proof_text = proof_section.group(1).strip()
-            proof_list = []
-            
             # Parse numbered items in the natural format Claude provides
-            proof_items = re.findall(r'(\d+\.\s+([^\n]+)\n(.*?)(?=\d+\.|$))', proof_text, re.DOTALL)
-            for full_match, header, content in proof_items:
-                proof_list.append({
-                    'header': header.strip(),
-                    'content': content.strip()
-                })
-            
-            tag_values['proof_list'] = proof_list
+            tag_values['proof_list'] = _parse_numbered_items(proof_text)
         
         # Extract potential concerns
-        concerns_section = re.search(r'POTENTIAL_CONCERNS:\s*\n(.*?)(?=\nCULTURAL_ALIGNMENT:|$)', claude_response, re.DOTALL)
+        concerns_section = _CONCERNS_RE.search(claude_response)
         if concerns_section:
             concerns_text = concerns_section.group(1).strip()
-            concern_list = []
-            
-            concern_items = re.findall(r'(\d+\.\s+([^\n]+)\n(.*?)(?=\d+\.|$))', concerns_text, re.DOTALL)
-            for full_match, header, content in concern_items:
-                concern_list.append({
-                    'header': header.strip(),
-                    'content': content.strip()
-                })
-            
-            tag_values['concern_list'] = concern_list
+            tag_values['concern_list'] = _parse_numbered_items(concerns_text)
         
         # Extract cultural alignment
-        culture_section = re.search(r'CULTURAL_ALIGNMENT:\s*\n(.*?)(?=\nSTRATEGIC_QUESTIONS:|$)', claude_response, re.DOTALL)
+        culture_section = _CULTURE_RE.search(claude_response)
         if culture_section:
             culture_text = culture_section.group(1).strip()
-            culture_list = []
-            
-            culture_items = re.findall(r'(\d+\.\s+([^\n]+)\n(.*?)(?=\d+\.|$))', culture_text, re.DOTALL)
-            for full_match, header, content in culture_items:
-                culture_list.append({
-                    'header': header.strip(),
-                    'content': content.strip()
-                })
-            
-            tag_values['culture_list'] = culture_list
+            tag_values['culture_list'] = _parse_numbered_items(culture_text)
         
         # Extract strategic questions
-        questions_section = re.search(r'STRATEGIC_QUESTIONS:\s*\n(.*?)(?=\nCLOSING_POSITIONING:|$)', claude_response, re.DOTALL)
+        questions_section = _QUESTIONS_RE.search(claude_response)
         if questions_section:
             questions_text = questions_section.group(1).strip()
             # Extract numbered questions
-            questions = re.findall(r'\d+\.\s*(.+?)(?=\n\d+\.|$)', questions_text, re.DOTALL)
+            questions = _QUESTION_RE.findall(questions_text)
             strategic_questions_list = [q.strip() for q in questions if q.strip()]
             tag_values['strategic_questions_list'] = strategic_questions_list
         
         # Extract closing positioning
-        closing_match = re.search(r'CLOSING_POSITIONING:\s*\n(.*?)$', claude_response, re.DOTALL)
+        closing_match = _CLOSING_RE.search(claude_response)
         if closing_match:
             tag_values['closing_positioning'] = closing_match.group(1).strip()
         
@@ -763,53 +857,106 @@ def parse_interview_prep_response(claude_response: str) -> Dict[str, Any]:
         return {}
 
 
-def extract_section(text: str, start_marker: str, end_marker: str) -> str:
-    """Extract text between two section markers."""
-    try:
-        start_pos = text.find(start_marker)
+class _SectionIndex:
+    """Remembers where each section marker first occurs in a response, so the many
+    section lookups made while parsing one response scan it once per marker."""
+    
+    def __init__(self, text: str):
+        self.text = text
+        self._first_pos: Dict[str, int] = {}
+    
+    def find(self, marker: str, start: int = 0) -> int:
+        """Same result as text.find(marker, start)"""
+        pos = self._first_pos.get(marker)
+        if pos is None:
+            pos = self._first_pos[marker] = self.text.find(marker)
+        if pos != -1 and pos < start:
+            # First occurrence is before start; look for a later one
+            return self.text.find(marker, start)
+        return pos
+    
+    def extract(self, start_marker: str, end_marker: str) -> str:
+        """Extract text between two section markers (see extract_section)."""
+        text = self.text
+        start_pos = self.find(start_marker)
         if start_pos == -1:
             return ""
         
         start_pos = text.find('\n', start_pos) + 1
         if end_marker:
-            end_pos = text.find(end_marker, start_pos)
+            end_pos = self.find(end_marker, start_pos)
             if end_pos == -1:
                 return text[start_pos:].strip()
             return text[start_pos:end_pos].strip()
         else:
             return text[start_pos:].strip()
+
+
+# Index for the most recently parsed text; parsing one response calls extract_section on it repeatedly
+_last_section_index: Optional[_SectionIndex] = None
+
+
+def _section_index(text: str) -> _SectionIndex:
+    """Return the section index for text, reusing the last one if it was built for this same string"""
+    global _last_section_index
+    index = _last_section_index
+    if index is None or index.text is not text:
+        index = _last_section_index = _SectionIndex(text)
+    return index
+
+
+def extract_section(text: str, start_marker: str, end_marker: str) -> str:
+    """Extract text between two section markers."""
+    try:
+        return _section_index(text).extract(start_marker, end_marker)
     except:
         return ""
 
 
+@lru_cache(maxsize=8)
+def _experience_section(text: str) -> Tuple[int, str]:
+    """
+    Locate the Professional Experience section of a resume.
+    
+    Returns the section's start position in text (-1 if missing) and the upper-cased text from
+    there on. Cached because the description and achievements extractors both search it for
+    every company in the same resume.
+    """
+    prof_exp_pos = text.find('Professional Experience')
+    if prof_exp_pos == -1:
+        prof_exp_pos = text.find('EXPERIENCE')
+    
+    if prof_exp_pos == -1:
+        return -1, ''
+    return prof_exp_pos, text[prof_exp_pos:].upper()
+
+
 def extract_company_description(text: str, company_name: str) -> str:
     """Extract role description for a specific company (the paragraph before the bullets)."""
     try:
         # Look for company in Professional Experience section only
-        prof_exp_pos = text.find('Professional Experience')
-        if prof_exp_pos == -1:
-            prof_exp_pos = text.find('EXPERIENCE')
-        
+        prof_exp_pos, search_upper = _experience_section(text)
         if prof_exp_pos == -1:
-            print(f"DEBUG: Professional Experience section not found")
+            logger.debug("Professional Experience section not found")
             return ""
         
         # Search for company only within Professional Experience section
-        search_text = text[prof_exp_pos:]
-        company_pos = search_text.upper().find(company_name.upper())
+        company_upper = company_name.upper()
+        company_pos = search_upper.find(company_upper)
         if company_pos == -1:
-            print(f"DEBUG: Company '{company_name}' not found in Professional Experience section")
+            logger.debug("Company '%s' not found in Professional Experience section", company_name)
             return ""
         
         # Adjust position to full text
         absolute_pos = prof_exp_pos + company_pos
-        print(f"DEBUG: Found {company_name} at position {absolute_pos} in Professional Experience")
+        logger.debug("Found %s at position %d in Professional Experience", company_name, absolute_pos)
         
         # Look for the description paragraph that comes before the bullet points
         section = text[absolute_pos:absolute_pos + 1000]  # Look ahead 1000 chars
         lines = section.split('\n')
         
-        print(f"DEBUG: Section for {company_name}: {section[:200]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Section for %s: %s...", company_name, section[:200])
         
         # Find the first non-bullet, non-empty line after finding the company
         descriptions = []
@@ -818,23 +965,26 @@ def extract_company_description(text: str, company_name: str) -> str:
             line = line.strip()
             if not found_company_line:
                 # Look for the actual company header line
-                if company_name.upper() in line.upper():
+                if company_upper in line.upper():
                     found_company_line = True
                 continue
             
-            if line and not line.startswith('•') and not line.upper().startswith(('ROOT', 'SURE', 'ENLACE', 'MANTA')):
+            # Next-company headers are matched case-insensitively by the regex, so
+            # lines after the company header are never upper-cased
+            is_company_header = _COMPANY_HEADER_RE.match(line) is not None
+            if line and not line.startswith('•') and not is_company_header:
                 # Skip lines that look like company headers (with pipe separators, company names like "ROOT INC", dates)
-                if '|' not in line and not line.upper().endswith(' INC') and not any(year in line for year in ['2018', '2019', '2020', '2021', '2022', '2023', '2024', '2025']):
+                if '|' not in line and line[-4:].upper() != ' INC' and not _YEAR_RE.search(line):
                     descriptions.append(line)
-                    print(f"DEBUG: Found description line for {company_name}: {line}")
-            elif line.startswith('•') or line.upper().startswith(('ROOT', 'SURE', 'ENLACE', 'MANTA')):
+                    logger.debug("Found description line for %s: %s", company_name, line)
+            elif line.startswith('•') or is_company_header:
                 break  # Stop when we hit bullets or next company
         
         result = '\n'.join(descriptions)
-        print(f"DEBUG: Final description for {company_name}: '{result}'")
+        logger.debug("Final description for %s: '%s'", company_name, result)
         return result
     except Exception as e:
-        print(f"DEBUG: Error extracting description for {company_name}: {str(e)}")
+        logger.debug("Error extracting description for %s: %s", company_name, e)
         return ""
 
 
@@ -853,6 +1003,44 @@ def extract_skills_heading_and_content(skills_section: str) -> tuple[str, str]:
     return "", ""
 
 
+_FALLBACK_SKILL_CATEGORIES = (
+    ('LEADERSHIP & MANAGEMENT', ''),
+    ('ENGINEERING & ARCHITECTURE', ''),
+)
+
+
+@lru_cache(maxsize=32)
+def _parse_skill_categories(skills_section: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parse a skills section into (heading, content) pairs.
+    
+    Cached on the section text so the Jinja and legacy tag extractors share one
+    parse per response; returns a tuple so the cached value can't be mutated.
+    """
+    categories = []
+    current_heading = None
+    
+    for line in skills_section.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+            
+        # Check if this looks like a skill category heading; cheap length/prefix tests run first
+        # and the '&'/keyword test is a single precompiled search
+        if (len(line) < 50 and not line.startswith('•') and line.isupper() and
+            _SKILL_HEADING_KEYWORD_RE.search(line)):
+            current_heading = line
+            logger.debug("Found skill category: %s", current_heading)
+        else:
+            # This is skill content for the current heading
+            if current_heading:
+                categories.append((current_heading, line))
+                logger.debug("Added skill category - Heading: '%s', Content: '%.50s...'", current_heading, line)
+                current_heading = None  # Reset for next category
+    
+    return tuple(categories)
+
+
 def extract_skill_categories_for_jinja(skills_section: str) -> list:
     """
     Extract skills section into structured list for Jinja template loops.
@@ -867,49 +1055,20 @@ def extract_skill_categories_for_jinja(skills_section: str) -> list:
         if not skills_section:
             return []
         
-        lines = skills_section.strip().split('\n')
-        categories = []
-        current_heading = None
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Check if this looks like a skill category heading
-            if (line.isupper() and len(line) < 50 and not line.startswith('•') and 
-                ('&' in line or any(keyword in line for keyword in ['LEADERSHIP', 'MANAGEMENT', 'ENGINEERING', 'ARCHITECTURE', 'TECHNICAL', 'BUSINESS']))):
-                current_heading = line
-                print(f"DEBUG: Found skill category: {current_heading}")
-            else:
-                # This is skill content for the current heading
-                if current_heading:
-                    categories.append({
-                        'heading': current_heading,
-                        'content': line
-                    })
-                    print(f"DEBUG: Added skill category - Heading: '{current_heading}', Content: '{line[:50]}...'")
-                    current_heading = None  # Reset for next category
-        
         # Fallback if no categories found
-        if not categories:
-            categories = [
-                {'heading': 'LEADERSHIP & MANAGEMENT', 'content': ''},
-                {'heading': 'ENGINEERING & ARCHITECTURE', 'content': ''}
-            ]
-        
-        print(f"DEBUG: Extracted {len(categories)} structured skill categories")
-        for i, cat in enumerate(categories):
-            print(f"  {i+1}. {cat['heading']}: {cat['content'][:30]}...")
+        pairs = _parse_skill_categories(skills_section) or _FALLBACK_SKILL_CATEGORIES
+        categories = [{'heading': heading, 'content': content} for heading, content in pairs]
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted %d structured skill categories", len(categories))
+            for i, cat in enumerate(categories):
+                logger.debug("  %d. %s: %.30s...", i + 1, cat['heading'], cat['content'])
             
         return categories
         
     except Exception as e:
-        print(f"DEBUG: Error extracting skill categories for Jinja: {str(e)}")
-        return [
-            {'heading': 'LEADERSHIP & MANAGEMENT', 'content': ''},
-            {'heading': 'ENGINEERING & ARCHITECTURE', 'content': ''}
-        ]
+        logger.debug("Error extracting skill categories for Jinja: %s", e)
+        return [{'heading': heading, 'content': content} for heading, content in _FALLBACK_SKILL_CATEGORIES]
 
 
 def extract_individual_skill_categories(skills_section: str) -> dict:
@@ -917,14 +1076,18 @@ def extract_individual_skill_categories(skills_section: str) -> dict:
     Legacy function - extract skills section into individual category tags.
     Kept for backward compatibility.
     """
-    skill_categories = extract_skill_categories_for_jinja(skills_section)
+    if not skills_section:
+        return {}
+    
+    try:
+        skill_categories = _parse_skill_categories(skills_section) or _FALLBACK_SKILL_CATEGORIES
+    except Exception as e:
+        logger.debug("Error extracting skill categories: %s", e)
+        skill_categories = _FALLBACK_SKILL_CATEGORIES
     
-    # Convert structured list back to individual tags for compatibility
+    # Convert parsed pairs to individual tags for compatibility
     individual_tags = {}
-    for category in skill_categories:
-        heading = category['heading']
-        content = category['content']
-        
+    for heading, content in skill_categories:
         if 'LEADERSHIP' in heading or 'MANAGEMENT' in heading:
             individual_tags['leadership_heading'] = heading
             individual_tags['leadership_skills'] = content
@@ -953,25 +1116,30 @@ def extract_key_achievements_list(text: str) -> list:
     try:
         key_achievements_section = extract_section(text, 'Key Achievements', 'Skills')
         achievements_list = []
+        add_achievement = achievements_list.append  # Bound once; looked up on every kept line otherwise
         
         if key_achievements_section:
-            for line in key_achievements_section.split('\n'):
+            for line in key_achievements_section.splitlines():
                 line = line.strip()
-                if line:
-                    # Remove number prefixes (1. 2. 3. etc.) and any leading whitespace
-                    import re
-                    clean_line = re.sub(r'^\d+\.\s*', '', line)  # Remove "1. ", "2. ", etc.
-                    if clean_line:  # Only add non-empty lines
-                        achievements_list.append(clean_line)
-        
-        print(f"DEBUG: Extracted {len(achievements_list)} key achievements without numbers")
-        for i, achievement in enumerate(achievements_list):
-            print(f"  {i+1}: {achievement[:50]}...")
+                if not line:
+                    continue
+                
+                # Remove number prefixes (1. 2. 3. etc.); only lines starting with a digit can have one
+                if line[0].isdigit():
+                    line = _NUM_PREFIX_RE.sub('', line, count=1)  # Remove "1. ", "2. ", etc.
+                    if not line:  # Nothing left after the number
+                        continue
+                add_achievement(line)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted %d key achievements without numbers", len(achievements_list))
+            for i, achievement in enumerate(achievements_list):
+                logger.debug("  %d: %.50s...", i + 1, achievement)
             
         return achievements_list
         
     except Exception as e:
-        print(f"DEBUG: Error extracting key achievements list: {str(e)}")
+        logger.debug("Error extracting key achievements list: %s", e)
         return []
 
 
@@ -992,30 +1160,30 @@ def extract_company_job_experience(text: str, company_name: str) -> dict:
         
         # Convert achievements text to list of individual bullets (without bullet symbols)
         achievements_list = []
+        add_achievement = achievements_list.append  # Bound once; looked up on every kept line otherwise
         if achievements_text:
-            for line in achievements_text.split('\n'):
+            for line in achievements_text.splitlines():
                 line = line.strip()
                 if line:
                     # Remove bullet symbols if present
                     clean_line = line
-                    if line.startswith('•'):
-                        clean_line = line[1:].strip()  # Remove '•' and trim spaces
-                    elif line.startswith('-'):
-                        clean_line = line[1:].strip()  # Remove '-' and trim spaces
+                    if line.startswith(_BULLET_PREFIXES):
+                        clean_line = line[1:].strip()  # Remove '•' or '-' and trim spaces
                     
                     if clean_line:
-                        achievements_list.append(clean_line)
+                        add_achievement(clean_line)
         
         result = {
             'description': description,
             'achievements': achievements_list
         }
         
-        print(f"DEBUG: Extracted job experience for {company_name}: description={bool(description)}, achievements={len(achievements_list)}")
+        logger.debug("Extracted job experience for %s: description=%s, achievements=%d",
+                     company_name, bool(description), len(achievements_list))
         return result
         
     except Exception as e:
-        print(f"DEBUG: Error extracting job experience for {company_name}: {str(e)}")
+        logger.debug("Error extracting job experience for %s: %s", company_name, e)
         return {'description': '', 'achievements': []}
 
 
@@ -1023,28 +1191,31 @@ def extract_company_achievements(text: str, company_name: str) -> str:
     """Extract achievement bullets for a specific company."""
     try:
         # Look for company in Professional Experience section only
-        prof_exp_pos = text.find('Professional Experience')
-        if prof_exp_pos == -1:
-            prof_exp_pos = text.find('EXPERIENCE')
-        
+        prof_exp_pos, search_upper = _experience_section(text)
         if prof_exp_pos == -1:
-            print(f"DEBUG: Professional Experience section not found for {company_name} achievements")
+            logger.debug("Professional Experience section not found for %s achievements", company_name)
             return ""
         
         # Search for company only within Professional Experience section
-        search_text = text[prof_exp_pos:]
-        company_pos = search_text.upper().find(company_name.upper())
+        company_upper = company_name.upper()
+        company_pos = search_upper.find(company_upper)
         if company_pos == -1:
-            print(f"DEBUG: Company '{company_name}' not found for achievements in Professional Experience")
+            logger.debug("Company '%s' not found for achievements in Professional Experience", company_name)
             return ""
         
         # Adjust position to full text
         absolute_pos = prof_exp_pos + company_pos
-        print(f"DEBUG: Extracting achievements for {company_name} at position {absolute_pos}")
+        logger.debug("Extracting achievements for %s at position %d", company_name, absolute_pos)
         
-        # Find achievements that come after this company but before the next company
-        section = text[absolute_pos:absolute_pos + 1000]  # Look ahead 1000 chars
-        lines = section.split('\n')
+        # Find achievements that come after this company but before the next company:
+        # locate the next company header or Education line once instead of testing every line
+        header_end = text.find('\n', absolute_pos)
+        if header_end == -1:
+            section = text[absolute_pos:]
+        else:
+            next_section = _NEXT_SECTION_RE.search(text, header_end + 1)
+            section = text[absolute_pos:next_section.start() if next_section else len(text)]
+        lines = section.splitlines()
         achievements = []
         found_company_line = False
         found_description = False
@@ -1052,32 +1223,34 @@ def extract_company_achievements(text: str, company_name: str) -> str:
         for line in lines:
             line = line.strip()
             if not found_company_line:
-                # Look for the actual company header line
-                if company_name.upper() in line.upper():
+                # Look for the actual company header line; only these lines need upper-casing
+                if company_upper in line.upper():
                     found_company_line = True
                 continue
             
-            if line.startswith('•') or line.startswith('-'):
+            if line.startswith(_BULLET_PREFIXES):
                 # This is clearly a bulleted achievement
                 achievements.append(line)
-                print(f"DEBUG: Found bullet for {company_name}: {line}")
-            elif line and not found_description and not line.upper().startswith(('ROOT', 'SURE', 'ENLACE', 'MANTA')) and 'Education' not in line:
+                logger.debug("Found bullet for %s: %s", company_name, line)
+                continue
+            
+            if not line:
+                continue
+            
+            if not found_description:
                 # This might be the role description - skip it
                 found_description = True
-                print(f"DEBUG: Skipping description line for {company_name}: {line}")
-            elif line and found_description and not line.upper().startswith(('ROOT', 'SURE', 'ENLACE', 'MANTA')) and 'Education' not in line:
+                logger.debug("Skipping description line for %s: %s", company_name, line)
+            else:
                 # After description, non-bullet lines might be achievements (if prompts removed bullets)
                 achievements.append(line)
-                print(f"DEBUG: Found non-bullet achievement for {company_name}: {line}")
-            elif line and (line.upper().startswith(('ROOT', 'SURE', 'ENLACE', 'MANTA')) or 'Education' in line):
-                # Stop when we hit the next company or education section
-                break
+                logger.debug("Found non-bullet achievement for %s: %s", company_name, line)
         
         result = '\n'.join(achievements)
-        print(f"DEBUG: Final achievements for {company_name}: Found {len(achievements)} achievements")
+        logger.debug("Final achievements for %s: Found %d achievements", company_name, len(achievements))
         return result
     except Exception as e:
-        print(f"DEBUG: Error extracting achievements for {company_name}: {str(e)}")
+        logger.debug("Error extracting achievements for %s: %s", company_name, e)
         return ""
 
 
@@ -1096,8 +1269,17 @@ def tag_based_template_replacement_claude(template_path: Path, dest_path: Path,
     """
     try:
         # Since Claude handles all tag replacements and returns the complete populated document,
-        # we just need to create a new document with the content Claude provided
-        return write_docx_content(dest_path, populated_content, preserve_formatting=True)
+        # we only need the template's styles, numbering, headers/footers and page setup:
+        # open it once, drop its body content and write Claude's content in its place
+        doc = Document(template_path)
+        body = doc.element.body
+        for child in list(body):
+            if child.tag != qn('w:sectPr'):
+                body.remove(child)
+        
+        _append_content_paragraphs(doc, populated_content)
+        doc.save(str(dest_path))
+        return True
         
     except Exception as e:
         print(f"Failed tag-based template replacement: {str(e)}")
@@ -1116,26 +1298,31 @@ def read_gdoc_content(file_path: Path) -> str:
         String containing the content, or empty string if can't read
     """
     try:
-        # Try to read as plain text file first
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # .gdoc files might contain JSON with URL info, try to extract useful content
-        import json
-        try:
-            gdoc_data = json.loads(content)
-            # This is a shortcut file, we can't directly read the content
-            # Return empty string to signal we need to look for alternative files
-            return ""
-        except json.JSONDecodeError:
-            # Not JSON, might be actual content
-            return content
+            # Drive shortcut .gdoc files are a JSON object with the document URL; their content
+            # can't be read here, so return "" to signal we need to look for alternative files.
+            # Peeking the first character avoids reading and parsing the whole shortcut.
+            first_char = f.read(1)
+            if first_char == '{':
+                return ""
+            
+            # Not a shortcut, might be actual content
+            return first_char + f.read()
             
     except Exception as e:
         print(f"Could not read .gdoc file {file_path}: {str(e)}")
         return ""
 
 
+def _list_dir_names(folder: Path) -> frozenset:
+    """Return the entry names in folder, or an empty set if it doesn't exist"""
+    try:
+        with os.scandir(folder) as entries:
+            return frozenset(entry.name for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
+
 def find_template_and_baseline_files(templates_folder: Path, baseline_resume_name: str) -> tuple[Optional[Path], Optional[Path]]:
     """
     Find both the template file (with "Template" in name) and baseline content file
@@ -1157,12 +1344,10 @@ def find_template_and_baseline_files(templates_folder: Path, baseline_resume_nam
             f"{baseline_resume_name}Template.gdoc"
         ]
         
-        template_file = None
-        for pattern in template_patterns:
-            potential_file = templates_folder / pattern
-            if potential_file.exists():
-                template_file = potential_file
-                break
+        # List each folder once and match patterns in memory instead of one exists() stat per pattern
+        template_names = _list_dir_names(templates_folder)
+        template_file = next((templates_folder / pattern for pattern in template_patterns
+                              if pattern in template_names), None)
         
         # Look for baseline content file in resumes subfolder (prefer .docx, then .gdoc, then .txt)
         baseline_patterns = [
@@ -1174,16 +1359,15 @@ def find_template_and_baseline_files(templates_folder: Path, baseline_resume_nam
         
         baseline_file = None
         resumes_folder = templates_folder / "resumes"
+        resume_names = _list_dir_names(resumes_folder)
         for pattern in baseline_patterns:
             # First try in resumes subfolder
-            potential_file = resumes_folder / pattern
-            if potential_file.exists():
-                baseline_file = potential_file
+            if pattern in resume_names:
+                baseline_file = resumes_folder / pattern
                 break
             # Fallback to templates folder root for backward compatibility
-            potential_file = templates_folder / pattern
-            if potential_file.exists():
-                baseline_file = potential_file
+            if pattern in template_names:
+                baseline_file = templates_folder / pattern
                 break
         
         return template_file, baseline_file
@@ -1216,7 +1400,7 @@ def extract_personal_info(baseline_content: str) -> dict:
         # Extract name (usually first non-empty line)
         for line in lines:
             line = line.strip()
-            if line and not line.startswith('•') and not line.startswith('-'):
+            if line and not line.startswith(_BULLET_PREFIXES):
                 # Check if this looks like a name (2-3 words, first letters capitalized)
                 words = line.split()
                 if len(words) >= 2 and len(words) <= 3:
@@ -1367,29 +1551,23 @@ def smart_content_replacement(source_path: Path, dest_path: Path, new_content: s
         True if successful, False otherwise
     """
     try:
-        import shutil
-        import re
-        
-        # First, make an exact copy of the source file
-        shutil.copy2(source_path, dest_path)
-        
-        # Load the copied document
-        doc = Document(dest_path)
+        # Load the source document directly; it is edited in memory and written to dest_path once
+        doc = Document(source_path)
         
         # Parse the new content to identify sections and their content
         sections = {}
         current_section = None
         section_content = []
         
-        for line in new_content.split('\n'):
+        for line in new_content.splitlines():
             line = line.strip()
             if not line:
                 continue
                 
-            # Check if this looks like a section header (ALL CAPS, ends with colon, or looks like a heading)
-            if (line.isupper() and len(line) < 50) or \
-               (line.endswith(':') and len(line) < 50) or \
-               re.match(r'^[A-Z][A-Za-z\s&-]+$', line) and len(line) < 50:
+            # Check if this looks like a section header (ALL CAPS, ends with colon, or looks like a heading).
+            # A lowercase first character already rules out ALL CAPS, so those lines skip isupper()
+            if len(line) < 50 and ((not line[:1].islower() and line.isupper()) or
+                                   _CONTENT_HEADER_RE.fullmatch(line)):
                 # Save previous section
                 if current_section and section_content:
                     sections[current_section.lower()] = section_content[:]
@@ -1405,48 +1583,62 @@ def smart_content_replacement(source_path: Path, dest_path: Path, new_content: s
         if current_section and section_content:
             sections[current_section.lower()] = section_content[:]
         
-        print(f"DEBUG: Identified {len(sections)} sections in new content")
-        for section_name in sections.keys():
-            print(f"  - {section_name}: {len(sections[section_name])} items")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Identified %d sections in new content", len(sections))
+            for section_name, items in sections.items():
+                logger.debug("  - %s: %d items", section_name, len(items))
         
         # Strategy: Try to intelligently match and replace content while preserving structure
         # This is a conservative approach - only replace content that we can confidently map
         
-        original_paragraphs = []
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                original_paragraphs.append((paragraph, paragraph.text.strip()))
+        paragraphs = doc.paragraphs
+        non_empty_indexes = [i for i, paragraph in enumerate(paragraphs) if paragraph.text.strip()]
         
-        print(f"DEBUG: Found {len(original_paragraphs)} non-empty paragraphs in original document")
+        logger.debug("Found %d non-empty paragraphs in original document", len(non_empty_indexes))
         
         # For now, use a simple but safe approach: replace the entire content but preserve key formatting
         # This ensures we don't break the document structure while still updating content
         
-        # Clear all content first
-        for paragraph, _ in original_paragraphs:
-            paragraph.clear()
-        
         # Add new content line by line, trying to preserve paragraph structure
-        content_lines = [line.strip() for line in new_content.split('\n') if line.strip()]
-        
-        # Ensure we have enough paragraphs
-        while len(doc.paragraphs) < len(content_lines):
-            doc.add_paragraph()
+        content_lines = [line.strip() for line in new_content.splitlines() if line.strip()]
+        
+        # Clear leftover content past the new lines; the paragraphs before that are rewritten below
+        for i in non_empty_indexes:
+            if i >= len(content_lines):
+                paragraphs[i].clear()
+        
+        # Ensure we have enough paragraphs. doc.paragraphs builds a new list on every access and
+        # doc.add_paragraph() searches the body for the section properties on each call, so
+        # insert all missing <w:p> elements ahead of the trailing sectPr in one slice assignment
+        missing = len(content_lines) - len(paragraphs)
+        if missing > 0:
+            body = doc.element.body
+            insert_at = body.index(body.sectPr) if body.sectPr is not None else len(body)
+            body[insert_at:insert_at] = [OxmlElement('w:p') for _ in range(missing)]
+            paragraphs = doc.paragraphs
         
         # Replace content paragraph by paragraph
-        for i, line in enumerate(content_lines):
-            if i < len(doc.paragraphs):
-                paragraph = doc.paragraphs[i]
-                paragraph.clear()
-                
-                # Determine formatting based on content
-                if (line.isupper() and len(line) < 50) or (line.endswith(':') and len(line) < 50):
-                    # This looks like a header
-                    run = paragraph.add_run(line)
-                    run.bold = True
-                else:
-                    # Regular content
-                    paragraph.add_run(line)
+        for paragraph, line in zip(paragraphs, content_lines):
+            # Determine formatting based on content
+            is_header = len(line) < 50 and (line.endswith(':') or (not line[:1].islower() and line.isupper()))
+            
+            # A paragraph holding exactly one run (and nothing else) keeps that run, which avoids
+            # removing and re-adding the <w:r>. Its character formatting is dropped so body lines
+            # come out plain, exactly as from clear() and add_run()
+            p = paragraph._p
+            if not is_header and len(p.r_lst) == 1 and len(p) == 1 + (p.pPr is not None):
+                p.r_lst[0]._remove_rPr()
+                paragraph.runs[0].text = line
+                continue
+            
+            paragraph.clear()
+            if is_header:
+                # This looks like a header
+                run = paragraph.add_run(line)
+                run.bold = True
+            else:
+                # Regular content
+                paragraph.add_run(line)
         
         # Save the updated document
         doc.save(str(dest_path))
@@ -1485,7 +1677,7 @@ def _map_experience_tag(tag_values: dict, mapped_values: dict, experience_key: s
                 continue
                 
             # Check if this line is an achievement (starts with bullet OR looks like an achievement)
-            if line.startswith('•') or line.startswith('-'):
+            if line.startswith(_BULLET_PREFIXES):
                 # This is clearly a bulleted achievement
                 found_first_achievement = True
                 # Remove the bullet symbol for clean achievements array
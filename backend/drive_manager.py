@@ -2,19 +2,68 @@
 
 import os
 import io
+import random
+import socket
+import ssl
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Collection, Dict, List, Optional, Tuple
 from pathlib import Path
+from email.utils import parsedate_to_datetime
 
+import httplib2
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
 from googleapiclient.http import BatchHttpRequest
 
 from backend.config_manager import get_config
 
 
+class _AdaptiveRateLimiter:
+    """
+    Spaces out API calls shared by every DriveManager, since the quota is per project.
+    
+    Each rate-limit (429) response doubles the gap between calls; every SUCCESSES_BEFORE_DECREASE
+    successful calls halve it again, so bursts settle at a rate the quota accepts instead of
+    repeatedly hitting 429s.
+    """
+    
+    SUCCESSES_BEFORE_DECREASE = 50
+    MAX_SPACING = 30.0  # seconds
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spacing = 0.0
+        self._next_allowed = 0.0
+        self._successes = 0
+    
+    def wait(self):
+        """Sleep until the next call is allowed and reserve the following slot"""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self._spacing
+        if delay > 0:
+            time.sleep(delay)
+    
+    def record_success(self):
+        with self._lock:
+            self._successes += 1
+            if self._spacing and self._successes >= self.SUCCESSES_BEFORE_DECREASE:
+                self._spacing = self._spacing / 2 if self._spacing > 0.05 else 0.0
+                self._successes = 0
+    
+    def record_rate_limited(self, base_delay: float):
+        with self._lock:
+            self._successes = 0
+            self._spacing = min(self.MAX_SPACING, max(base_delay, self._spacing * 2))
+
+
 class DriveManager:
     """Manages Google Drive API operations for resume automation"""
     
@@ -24,64 +73,217 @@ class DriveManager:
         'https://www.googleapis.com/auth/documents'
     ]
     
+    # Shared by all instances so concurrent packages back off together
+    _rate_limiter = _AdaptiveRateLimiter()
+    
+    # (credentials, drive service, docs service) per service account file, shared by all instances
+    _clients: Dict[str, Tuple[service_account.Credentials, object, object]] = {}
+    _clients_lock = threading.Lock()
+    
+    # Seconds a listing of the templates folder is reused before listing it again
+    TEMPLATE_CACHE_TTL = 300
+    
+    # Seconds a listing of the output folder's subfolders is reused before listing it again
+    FOLDER_CACHE_TTL = 300
+    
+    # Server-side HTTP errors worth retrying (429 is handled separately through the rate limiter)
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    
+    # Partial-response mask for documents().get when only the text length is needed
+    END_INDEX_FIELDS = 'body/content/paragraph/elements/textRun/content'
+    
     def __init__(self):
         self.config = get_config()
         self.drive_service = None
         self.docs_service = None
+        self._credentials = None
+        self._template_files: Optional[Tuple[float, List[Dict[str, str]]]] = None
+        # template_id -> (Drive version the end index was measured at, end index)
+        self._template_end_index_cache: Dict[str, Tuple[str, int]] = {}
+        self._folder_listings: Dict[str, Tuple[float, Dict[str, str]]] = {}
+        self._load_settings()
         self._authenticate()
     
+    def _load_settings(self):
+        """Read the settings used on every API call or package once, instead of per call"""
+        self._max_retries = self.config.get('system.max_retries', 5)
+        self._base_delay = self.config.get('system.rate_limit_delay', 1.0)
+        self._output_folder_id = self.config.resolved.drive_output_folder_id
+        self._folder_structure = self.config.get('file_organization.folder_structure')
+        
+        file_config = self.config.get_file_organization_config()
+        self._resume_filename = file_config.get('resume_filename', 'Resume')
+        self._cover_letter_filename = file_config.get('cover_letter_filename', 'Cover Letter')
+        self._generate_pdf = file_config.get('generate_pdf', True)
+        self._cover_letter_template_id = self.config.get('google_drive.cover_letter_template_id')
+    
     def _authenticate(self):
         """Authenticate using service account credentials"""
         try:
-            service_account_file = self.config.get('google_drive.service_account_file')
-            
-            if not os.path.exists(service_account_file):
-                raise FileNotFoundError(
-                    f"Service account file not found: {service_account_file}. "
-                    "Please download your service account JSON file from Google Cloud Console."
-                )
-            
-            creds = service_account.Credentials.from_service_account_file(
-                service_account_file, 
-                scopes=self.SCOPES
-            )
-            
-            self.drive_service = build('drive', 'v3', credentials=creds)
-            self.docs_service = build('docs', 'v1', credentials=creds)
+            service_account_file = self.config.resolved.drive_service_account_file
+            
+            # Reuse the credentials and services another instance built from the same file
+            with DriveManager._clients_lock:
+                clients = DriveManager._clients.get(service_account_file)
+                if clients is None:
+                    if not os.path.exists(service_account_file):
+                        raise FileNotFoundError(
+                            f"Service account file not found: {service_account_file}. "
+                            "Please download your service account JSON file from Google Cloud Console."
+                        )
+                    
+                    self._credentials = service_account.Credentials.from_service_account_file(
+                        service_account_file, 
+                        scopes=self.SCOPES
+                    )
+                    
+                    # One authorized client for both services: they share its kept-alive connections
+                    # (one per API host), its response cache and a single token refresh. The discovery
+                    # documents come from the copies bundled with google-api-python-client
+                    authorized_http = self._authorized_http()
+                    clients = (
+                        self._credentials,
+                        build('drive', 'v3', http=authorized_http, static_discovery=True),
+                        build('docs', 'v1', http=authorized_http, static_discovery=True)
+                    )
+                    DriveManager._clients[service_account_file] = clients
+            
+            self._credentials, self.drive_service, self.docs_service = clients
             
         except Exception as e:
             raise Exception(f"Failed to authenticate with Google Drive: {str(e)}")
     
+    def _authorized_http(self) -> AuthorizedHttp:
+        """Build an authorized HTTP client, caching GET responses on disk only when system.http_cache_dir is set"""
+        # httplib2's file cache stores every cacheable response body (including exported
+        # document text) and never evicts, so it stays off unless explicitly configured
+        http = httplib2.Http(
+            cache=self.config.get('system.http_cache_dir') or None,
+            timeout=self.config.get('system.timeout', 30)
+        )
+        return AuthorizedHttp(self._credentials, http=http)
+    
     def _handle_api_errors(self, func, *args, **kwargs):
-        """Handle API errors with exponential backoff"""
-        max_retries = self.config.get('system.max_retries', 5)
-        base_delay = self.config.get('system.rate_limit_delay', 1.0)
+        """Handle API errors with adaptive call spacing and jittered exponential backoff"""
+        max_retries = self._max_retries
+        base_delay = self._base_delay
         
         for attempt in range(max_retries):
+            self._rate_limiter.wait()
             try:
-                return func(*args, **kwargs)
+                result = func(*args, **kwargs)
+                self._rate_limiter.record_success()
+                return result
             except HttpError as error:
-                if error.resp.status == 429:  # Rate limit exceeded (429 only)
+                status = error.resp.status
+                if status == 429 or status in self.RETRY_STATUSES:
+                    if status == 429:  # Rate limit exceeded
+                        self._rate_limiter.record_rate_limited(base_delay)
                     if attempt == max_retries - 1:
                         raise error
                     
-                    delay = base_delay * (2 ** attempt)
-                    print(f"Rate limit hit. Waiting {delay} seconds... (attempt {attempt + 1})")
+                    # Honor the server's Retry-After; otherwise back off with jitter so
+                    # concurrent callers don't retry in lockstep
+                    delay = self._retry_after_seconds(error)
+                    if delay is None:
+                        delay = base_delay * (2 ** attempt) * random.uniform(0.5, 1.5)
+                    reason = "Rate limit hit" if status == 429 else f"Server error ({status})"
+                    print(f"{reason}. Waiting {delay:.1f} seconds... (attempt {attempt + 1})")
                     time.sleep(delay)
-                elif error.resp.status == 403:  # Permission denied - don't retry
+                elif status == 403:  # Permission denied - don't retry
                     print(f"Permission denied (403): {error}")
                     raise error
                 else:
                     raise error
-            except Exception as e:
+            except (socket.timeout, ConnectionError, ssl.SSLError) as e:
+                # Transient network failure; any other exception is a bug or bad input and is raised at once
                 if attempt == max_retries - 1:
                     raise e
                 time.sleep(base_delay)
     
-    def list_template_files(self) -> List[Dict[str, str]]:
-        """List all Google Docs in the templates folder"""
+    @staticmethod
+    def _retry_after_seconds(error: HttpError) -> Optional[float]:
+        """Seconds to wait from an error's Retry-After header (delay-seconds or HTTP-date), or None"""
+        retry_after = error.resp.get('retry-after')
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    
+    def _execute_batch(self, service, request_factories: Dict[str, Callable],
+                       non_idempotent: Collection[str] = ()) -> Dict[str, Optional[dict]]:
+        """
+        Run independent API requests in one batch round trip.
+        
+        request_factories maps a request id to a callable that builds the request. The batch is sent
+        once; requests it reports as failed with a retryable status are rebuilt and retried on their
+        own through _handle_api_errors. If the batch fails as a whole the server may still have run
+        part of it, so the request ids in non_idempotent (copies, edits) are then treated as failed
+        rather than sent again. Requests that fail map to None.
+        """
+        if not request_factories:
+            return {}
+        
+        responses = {}
+        retry = set()
+        if len(request_factories) > 1:
+            def _collect(request_id, response, exception):
+                if exception is None:
+                    responses[request_id] = response
+                elif isinstance(exception, HttpError) and (
+                        exception.resp.status == 429 or exception.resp.status in self.RETRY_STATUSES):
+                    retry.add(request_id)
+                else:
+                    print(f"Error in request {request_id}: {str(exception)}")
+                    responses[request_id] = None
+            
+            batch = service.new_batch_http_request(callback=_collect)
+            for request_id, make_request in request_factories.items():
+                batch.add(make_request(), request_id=request_id)
+            
+            # Not retried as a whole: that would repeat the requests that already went through
+            self._rate_limiter.wait()
+            try:
+                batch.execute()
+                self._rate_limiter.record_success()
+            except Exception as e:
+                print(f"Batch request failed: {str(e)}")
+            
+            for request_id in request_factories:
+                if request_id in responses or request_id in retry:
+                    continue
+                if request_id in non_idempotent:
+                    print(f"Not resending request {request_id}; the failed batch may already have run it")
+                    responses[request_id] = None
+                else:
+                    retry.add(request_id)
+        else:
+            retry.update(request_factories)
+        
+        for request_id, make_request in request_factories.items():
+            if request_id in retry:
+                try:
+                    responses[request_id] = self._handle_api_errors(lambda: make_request().execute())
+                except Exception as e:
+                    print(f"Error in request {request_id}: {str(e)}")
+                    responses[request_id] = None
+        
+        return responses
+    
+    def list_template_files(self, refresh: bool = False) -> List[Dict[str, str]]:
+        """List all Google Docs in the templates folder, reusing the listing for TEMPLATE_CACHE_TTL seconds"""
+        cached = self._template_files
+        if not refresh and cached and time.monotonic() - cached[0] < self.TEMPLATE_CACHE_TTL:
+            return list(cached[1])
+        
         try:
-            templates_folder_id = self.config.get('google_drive.templates_folder_id')
+            templates_folder_id = self.config.resolved.drive_templates_folder_id
             
             query = (
                 f"'{templates_folder_id}' in parents and "
@@ -89,15 +291,26 @@ class DriveManager:
                 "trashed=false"
             )
             
-            def _list_files():
-                return self.drive_service.files().list(
-                    q=query,
-                    fields="nextPageToken, files(id, name, mimeType, modifiedTime)",
-                    pageSize=100
-                ).execute()
+            files = []
+            page_token = None
+            while True:
+                def _list_files():
+                    return self.drive_service.files().list(
+                        q=query,
+                        fields="nextPageToken, files(id, name, mimeType, modifiedTime)",
+                        pageSize=1000,
+                        pageToken=page_token
+                    ).execute()
+                
+                results = self._handle_api_errors(_list_files)
+                files.extend(results.get('files', []))
+                
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
             
-            results = self._handle_api_errors(_list_files)
-            return results.get('files', [])
+            self._template_files = (time.monotonic(), files)
+            return list(files)
             
         except Exception as e:
             print(f"Error listing template files: {str(e)}")
@@ -106,40 +319,54 @@ class DriveManager:
     def find_template_by_name(self, template_name: str) -> Optional[str]:
         """Find template file ID by name"""
         templates = self.list_template_files()
+        template_id = self._match_template_name(templates, template_name)
+        if template_id is not None:
+            return template_id
         
-        # First try exact match
-        for template in templates:
-            if template['name'].lower() == template_name.lower():
-                return template['id']
+        # The cached listing may predate a newly added template; list the folder again before giving up
+        templates = self.list_template_files(refresh=True)
+        template_id = self._match_template_name(templates, template_name)
+        if template_id is not None:
+            return template_id
         
-        # Then try partial match (template_name contains part of document name)
-        for template in templates:
-            if template_name.lower() in template['name'].lower():
-                return template['id']
+        print(f"Template not found: '{template_name}'")
+        print(f"Available templates: {[t['name'] for t in templates]}")
+        return None
+    
+    @staticmethod
+    def _match_template_name(templates: List[Dict[str, str]], template_name: str) -> Optional[str]:
+        """Return the ID of the template whose name best matches template_name, or None"""
+        target = template_name.lower()
         
-        # Finally try reverse match (document name contains part of template_name)
+        # One pass over the templates, keeping the first template at the best match level:
+        # 3 = exact match, 2 = template_name contained in the document name,
+        # 1 = document name contained in template_name
+        best_priority, best_id = 0, None
         for template in templates:
-            if template['name'].lower() in template_name.lower():
+            name = template['name'].lower()
+            if name == target:
                 return template['id']
+            if best_priority < 2 and target in name:
+                best_priority, best_id = 2, template['id']
+            elif best_priority < 1 and name in target:
+                best_priority, best_id = 1, template['id']
         
-        print(f"Template not found: '{template_name}'")
-        print(f"Available templates: {[t['name'] for t in templates]}")
-        return None
+        return best_id if best_priority else None
     
     def create_job_folder(self, company_name: str, position_title: str) -> str:
         """Create folder structure for job application"""
         try:
-            output_folder_id = self.config.get('google_drive.output_folder_id')
-            folder_structure = self.config.get('file_organization.folder_structure')
+            output_folder_id = self._output_folder_id
             
             # Format folder name
-            folder_name = folder_structure.format(
+            folder_name = self._folder_structure.format(
                 company_name=company_name,
                 position_title=position_title
             ).strip('/')
             
             # Check if folder already exists
-            existing_folder = self._find_folder_by_name(folder_name, output_folder_id)
+            folders = self._child_folders(output_folder_id)
+            existing_folder = folders.get(folder_name)
             if existing_folder:
                 return existing_folder
             
@@ -157,57 +384,74 @@ class DriveManager:
                 ).execute()
             
             folder = self._handle_api_errors(_create_folder)
-            return folder.get('id')
+            folder_id = folder.get('id')
+            if folder_id:
+                folders[folder_name] = folder_id  # The next package for this job skips the lookup
+            return folder_id
             
         except Exception as e:
             print(f"Error creating job folder: {str(e)}")
             return output_folder_id  # Fallback to main output folder
     
-    def _find_folder_by_name(self, folder_name: str, parent_id: str) -> Optional[str]:
-        """Find folder by name within parent folder"""
+    def _child_folders(self, parent_id: str) -> Dict[str, str]:
+        """
+        Map folder name -> ID for the folders in parent folder.
+        
+        The parent is listed once (paginated) and the listing reused for FOLDER_CACHE_TTL seconds,
+        so checking whether a job folder exists doesn't cost a round trip per package.
+        """
+        cached = self._folder_listings.get(parent_id)
+        if cached and time.monotonic() - cached[0] < self.FOLDER_CACHE_TTL:
+            return cached[1]
+        
         try:
             query = (
                 f"'{parent_id}' in parents and "
-                f"name='{folder_name}' and "
                 "mimeType='application/vnd.google-apps.folder' and "
                 "trashed=false"
             )
             
-            def _search_folder():
-                return self.drive_service.files().list(
-                    q=query,
-                    fields="files(id)"
-                ).execute()
-            
-            results = self._handle_api_errors(_search_folder)
-            files = results.get('files', [])
+            folders = {}
+            page_token = None
+            while True:
+                def _list_folders():
+                    return self.drive_service.files().list(
+                        q=query,
+                        fields="nextPageToken, files(id, name)",
+                        pageSize=1000,
+                        pageToken=page_token
+                    ).execute()
+                
+                results = self._handle_api_errors(_list_folders)
+                for folder in results.get('files', []):
+                    folders.setdefault(folder['name'], folder['id'])
+                
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
             
-            return files[0]['id'] if files else None
+            self._folder_listings[parent_id] = (time.monotonic(), folders)
+            return folders
             
         except Exception as e:
             print(f"Error finding folder: {str(e)}")
-            return None
+            return {}
     
     def get_document_content(self, document_id: str) -> Optional[str]:
         """Get the text content of a Google Doc"""
         try:
-            def _get_doc():
-                return self.docs_service.documents().get(documentId=document_id).execute()
-            
-            document = self._handle_api_errors(_get_doc)
-            
-            # Extract text content from document structure
-            content = ""
-            doc_content = document.get('body', {}).get('content', [])
+            # Export as plain text rather than fetching the full document structure (styles, lists,
+            # inline objects) only to keep its text runs
+            def _export_text():
+                return self.drive_service.files().export_media(
+                    fileId=document_id,
+                    mimeType='text/plain'
+                ).execute()
             
-            for element in doc_content:
-                if 'paragraph' in element:
-                    paragraph = element['paragraph']
-                    for content_element in paragraph.get('elements', []):
-                        if 'textRun' in content_element:
-                            content += content_element['textRun'].get('content', '')
+            text = self._handle_api_errors(_export_text)
             
-            return content.strip()
+            # The export starts with a byte order mark and uses CRLF line endings
+            return text.decode('utf-8-sig').replace('\r\n', '\n').strip()
             
         except Exception as e:
             print(f"Error getting document content: {str(e)}")
@@ -235,6 +479,51 @@ class DriveManager:
             print(f"Error copying template: {str(e)}")
             return None
     
+    def copy_templates(self, copies: Dict[str, Tuple[str, str]], destination_folder_id: str) -> Dict[str, Optional[str]]:
+        """Copy several templates to the destination folder in one batch, mapping each key of copies to (template_id, new_name)"""
+        return self._copy_templates_with_versions(copies, destination_folder_id)[0]
+    
+    def _copy_templates_with_versions(self, copies: Dict[str, Tuple[str, str]],
+                                      destination_folder_id: str) -> Tuple[Dict[str, Optional[str]], Dict[str, Optional[str]]]:
+        """
+        Copy several templates and read each template's current Drive version in the same batch.
+        
+        Returns the copied file IDs by key of copies, and the version of each template ID
+        (None where it could not be read).
+        """
+        template_ids = {template_id for template_id, _ in copies.values()}
+        try:
+            request_factories = {
+                f'copy:{key}': partial(
+                    self.drive_service.files().copy,
+                    fileId=template_id,
+                    body={'name': new_name, 'parents': [destination_folder_id]},
+                    fields='id, name, webViewLink'
+                )
+                for key, (template_id, new_name) in copies.items()
+            }
+            request_factories.update({
+                f'version:{template_id}': partial(self.drive_service.files().get, fileId=template_id, fields='version')
+                for template_id in template_ids
+            })
+            responses = self._execute_batch(
+                self.drive_service, request_factories, non_idempotent=[f'copy:{key}' for key in copies]
+            )
+            
+            copied_ids = {}
+            for key in copies:
+                copied_file = responses.get(f'copy:{key}')
+                copied_ids[key] = copied_file.get('id') if copied_file else None
+            versions = {}
+            for template_id in template_ids:
+                template_file = responses.get(f'version:{template_id}')
+                versions[template_id] = template_file.get('version') if template_file else None
+            return copied_ids, versions
+            
+        except Exception as e:
+            print(f"Error copying templates: {str(e)}")
+            return dict.fromkeys(copies), dict.fromkeys(template_ids)
+    
     def create_document(self, title: str, folder_id: str) -> Optional[str]:
         """Create a new Google Doc in the specified folder"""
         try:
@@ -268,9 +557,6 @@ class DriveManager:
     def _create_text_file(self, title: str, folder_id: str) -> Optional[str]:
         """Fallback: Create a plain text file instead of Google Doc"""
         try:
-            from googleapiclient.http import MediaIoBaseUpload
-            import io
-            
             # Create empty text content
             content = f"# {title}\n\n[Content will be updated after creation]"
             media = MediaIoBaseUpload(
@@ -299,75 +585,156 @@ class DriveManager:
     
     def update_document_content(self, document_id: str, content: str) -> bool:
         """Update document content by replacing all text"""
+        return self.update_documents_content({document_id: content}).get(document_id, False)
+    
+    def update_documents_content(self, contents: Dict[str, str],
+                                 end_indexes: Optional[Dict[str, int]] = None) -> Dict[str, bool]:
+        """
+        Replace the text of several documents, batching the reads and the writes into one round trip each.
+        
+        end_indexes gives the end index of documents whose length is already known (such as fresh
+        copies of a template); those are updated in a single batchUpdate without reading them first.
+        """
         try:
-            # First, get the document to find its length
-            def _get_doc():
-                return self.docs_service.documents().get(documentId=document_id).execute()
-            
-            document = self._handle_api_errors(_get_doc)
-            
-            # Calculate the end index (length of document content)
-            doc_content = document.get('body', {}).get('content', [])
-            end_index = 1  # Start at 1 (Google Docs default)
-            
-            for element in doc_content:
-                if 'paragraph' in element:
-                    for content_element in element['paragraph'].get('elements', []):
-                        if 'textRun' in content_element:
-                            text_run = content_element['textRun']
-                            if 'content' in text_run:
-                                end_index += len(text_run['content'])
-            
-            # Replace all content
-            requests = [
-                {
-                    'deleteContentRange': {
-                        'range': {
-                            'startIndex': 1,
-                            'endIndex': end_index
-                        }
-                    }
-                },
-                {
-                    'insertText': {
-                        'location': {
-                            'index': 1
-                        },
-                        'text': content
-                    }
-                }
-            ]
-            
-            def _batch_update():
-                return self.docs_service.documents().batchUpdate(
-                    documentId=document_id,
-                    body={'requests': requests}
-                ).execute()
+            end_indexes = end_indexes or {}
+            responses = self._replace_documents_text(contents, end_indexes)
+            
+            # A known end index is stale if the template was edited since it was measured and the
+            # update is rejected; read those documents and try again
+            stale = {
+                document_id: content for document_id, content in contents.items()
+                if document_id in end_indexes and responses.get(document_id) is None
+            }
+            if stale:
+                responses.update(self._replace_documents_text(stale, {}))
             
-            self._handle_api_errors(_batch_update)
-            return True
+            return {document_id: responses.get(document_id) is not None for document_id in contents}
             
         except Exception as e:
             print(f"Error updating document content: {str(e)}")
-            return False
+            return dict.fromkeys(contents, False)
+    
+    def _replace_documents_text(self, contents: Dict[str, str], end_indexes: Dict[str, int]) -> Dict[str, Optional[dict]]:
+        """Read the documents missing from end_indexes, then replace the text of all of them in one batch"""
+        # First, get the documents to find their lengths
+        documents = self._execute_batch(self.docs_service, {
+            document_id: partial(self.docs_service.documents().get, documentId=document_id, fields=self.END_INDEX_FIELDS)
+            for document_id in contents
+            if document_id not in end_indexes
+        })
+        end_indexes = dict(end_indexes)
+        for document_id, document in documents.items():
+            if document is not None:
+                end_indexes[document_id] = self._document_end_index(document)
+        
+        # Replace all content; an edit is not resent after a failed batch, since it may have
+        # already run and its delete range would then be wrong
+        updates = {
+            document_id: partial(
+                self.docs_service.documents().batchUpdate,
+                documentId=document_id,
+                body={'requests': self._replace_content_requests(end_indexes[document_id], content)}
+            )
+            for document_id, content in contents.items()
+            if document_id in end_indexes
+        }
+        return self._execute_batch(self.docs_service, updates, non_idempotent=updates.keys())
+    
+    def _template_end_indexes(self, template_versions: Dict[str, Optional[str]]) -> Dict[str, int]:
+        """
+        End indexes of the given templates at their current Drive versions.
+        
+        An end index is reused only while the template's version is unchanged; otherwise the
+        templates are read again in one batch. Templates whose text could not be read are left
+        out, so their copies are measured directly before being filled.
+        """
+        end_indexes = {}
+        outdated = []
+        for template_id, version in template_versions.items():
+            cached = self._template_end_index_cache.get(template_id)
+            if version is not None and cached is not None and cached[0] == version:
+                end_indexes[template_id] = cached[1]
+            else:
+                outdated.append(template_id)
+        
+        documents = self._execute_batch(self.docs_service, {
+            template_id: partial(self.docs_service.documents().get, documentId=template_id, fields=self.END_INDEX_FIELDS)
+            for template_id in outdated
+        })
+        for template_id, document in documents.items():
+            version = template_versions[template_id]
+            if document is not None:
+                end_indexes[template_id] = self._document_end_index(document)
+            
+            # Only an index measured at a known version can be trusted for the next package
+            if document is None or version is None:
+                self._template_end_index_cache.pop(template_id, None)
+            else:
+                self._template_end_index_cache[template_id] = (version, end_indexes[template_id])
+        
+        return end_indexes
+    
+    @staticmethod
+    def _document_end_index(document: dict) -> int:
+        """Calculate the end index (length of document content) from a documents().get response"""
+        doc_content = document.get('body', {}).get('content', [])
+        end_index = 1  # Start at 1 (Google Docs default)
+        
+        for element in doc_content:
+            if 'paragraph' in element:
+                for content_element in element['paragraph'].get('elements', []):
+                    if 'textRun' in content_element:
+                        text_run = content_element['textRun']
+                        if 'content' in text_run:
+                            end_index += len(text_run['content'])
+        
+        return end_index
+    
+    @staticmethod
+    def _replace_content_requests(end_index: int, content: str) -> List[dict]:
+        """Build the batchUpdate requests that replace all text up to end_index with content"""
+        return [
+            {
+                'deleteContentRange': {
+                    'range': {
+                        'startIndex': 1,
+                        'endIndex': end_index
+                    }
+                }
+            },
+            {
+                'insertText': {
+                    'location': {
+                        'index': 1
+                    },
+                    'text': content
+                }
+            }
+        ]
     
-    def export_as_pdf(self, file_id: str, output_path: str) -> bool:
-        """Export Google Doc as PDF"""
+    def export_as_pdf(self, file_id: str, output_path: str, http: Optional[AuthorizedHttp] = None) -> bool:
+        """Export Google Doc as PDF, optionally over a caller-owned HTTP client (needed off the main thread)"""
         try:
-            def _export_pdf():
-                return self.drive_service.files().export_media(
-                    fileId=file_id,
-                    mimeType='application/pdf'
-                ).execute()
-            
-            pdf_content = self._handle_api_errors(_export_pdf)
+            request = self.drive_service.files().export_media(
+                fileId=file_id,
+                mimeType='application/pdf'
+            )
+            if http is not None:
+                request.http = http
             
             # Ensure output directory exists
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             
-            # Write PDF content to file
-            with open(output_path, 'wb') as f:
-                f.write(pdf_content)
+            # Stream the PDF to the file in chunks instead of holding the whole export in memory
+            try:
+                with open(output_path, 'wb') as f:
+                    downloader = MediaIoBaseDownload(f, request, chunksize=1024 * 1024)
+                    done = False
+                    while not done:
+                        _, done = self._handle_api_errors(downloader.next_chunk)
+            except Exception:
+                Path(output_path).unlink(missing_ok=True)  # Don't leave a truncated PDF behind
+                raise
             
             return True
             
@@ -375,6 +742,23 @@ class DriveManager:
             print(f"Error exporting PDF: {str(e)}")
             return False
     
+    def _export_pdfs(self, exports: Dict[str, Tuple[str, str]]) -> Dict[str, str]:
+        """
+        Export several documents as PDF concurrently, mapping each key of exports to (file_id, output_path).
+        
+        Returns the output path of each export that succeeded. httplib2 clients aren't thread-safe,
+        so every worker exports over its own authorized HTTP client.
+        """
+        if len(exports) < 2:
+            return {key: path for key, (file_id, path) in exports.items() if self.export_as_pdf(file_id, path)}
+        
+        with ThreadPoolExecutor(max_workers=len(exports)) as pool:
+            futures = {
+                key: pool.submit(self.export_as_pdf, file_id, path, http=self._authorized_http())
+                for key, (file_id, path) in exports.items()
+            }
+            return {key: exports[key][1] for key, future in futures.items() if future.result()}
+    
     def get_document_link(self, file_id: str) -> str:
         """Get shareable link to Google Doc"""
         return f"https://docs.google.com/document/d/{file_id}/edit"
@@ -411,50 +795,60 @@ class DriveManager:
             job_folder_id = self.create_job_folder(company_name, position_title)
             
             # Generate file names
-            file_config = self.config.get_file_organization_config()
-            resume_name = file_config.get('resume_filename', 'Resume').format(
+            resume_name = self._resume_filename.format(
                 company_name=company_name,
                 position_title=position_title
             )
-            cover_letter_name = file_config.get('cover_letter_filename', 'Cover Letter').format(
+            cover_letter_name = self._cover_letter_filename.format(
                 company_name=company_name,
                 position_title=position_title
             )
             
             results = {}
             
-            # Create resume
-            resume_id = self.copy_template(template_id, resume_name, job_folder_id)
-            if resume_id:
-                if self.update_document_content(resume_id, resume_content):
-                    results['resume_id'] = resume_id
-                    results['resume_link'] = self.get_document_link(resume_id)
-                    
-                    # Generate PDF if configured
-                    if file_config.get('generate_pdf', True):
-                        pdf_path = f"output/{resume_name}.pdf"
-                        if self.export_as_pdf(resume_id, pdf_path):
-                            results['resume_pdf_path'] = pdf_path
-            
-            # Create cover letter by copying template
-            cover_letter_template_id = self.config.get('google_drive.cover_letter_template_id')
+            # Copy the resume and cover letter templates in one batch; the copies don't depend on each other
+            copies = {'resume': (template_id, resume_name)}
+            cover_letter_template_id = self._cover_letter_template_id
             if cover_letter_template_id:
-                cover_letter_id = self.copy_template(cover_letter_template_id, cover_letter_name, job_folder_id)
-                if cover_letter_id:
-                    if self.update_document_content(cover_letter_id, cover_letter_content):
-                        results['cover_letter_id'] = cover_letter_id
-                        results['cover_letter_link'] = self.get_document_link(cover_letter_id)
-                        
-                        # Generate PDF if configured
-                        if file_config.get('generate_pdf', True):
-                            pdf_path = f"output/{cover_letter_name}.pdf"
-                            if self.export_as_pdf(cover_letter_id, pdf_path):
-                                results['cover_letter_pdf_path'] = pdf_path
-                else:
-                    print(f"Failed to copy cover letter template: {cover_letter_template_id}")
+                copies['cover_letter'] = (cover_letter_template_id, cover_letter_name)
             else:
                 print("No cover letter template configured")
             
+            copied_ids, template_versions = self._copy_templates_with_versions(copies, job_folder_id)
+            resume_id = copied_ids.get('resume')
+            cover_letter_id = copied_ids.get('cover_letter')
+            if cover_letter_template_id and not cover_letter_id:
+                print(f"Failed to copy cover letter template: {cover_letter_template_id}")
+            
+            # Fill both copies in one batch of writes. A fresh copy is as long as its template, so the
+            # template lengths (cached per template version) stand in for reading each copy
+            template_end_indexes = self._template_end_indexes(template_versions)
+            contents = {}
+            end_indexes = {}
+            for key, document_id, content in (
+                ('resume', resume_id, resume_content),
+                ('cover_letter', cover_letter_id, cover_letter_content)
+            ):
+                if document_id:
+                    contents[document_id] = content
+                    if copies[key][0] in template_end_indexes:
+                        end_indexes[document_id] = template_end_indexes[copies[key][0]]
+            updated = self.update_documents_content(contents, end_indexes)
+            
+            pdf_exports = {}
+            for key, document_id, document_name in (
+                ('resume', resume_id, resume_name),
+                ('cover_letter', cover_letter_id, cover_letter_name)
+            ):
+                if document_id and updated.get(document_id):
+                    results[f'{key}_id'] = document_id
+                    results[f'{key}_link'] = self.get_document_link(document_id)
+                    
+                    # Generate PDF if configured
+                    if self._generate_pdf:
+                        pdf_exports[f'{key}_pdf_path'] = (document_id, f"output/{document_name}.pdf")
+            
+            results.update(self._export_pdfs(pdf_exports))
             results['folder_id'] = job_folder_id
             return results
             
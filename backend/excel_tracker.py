@@ -3,11 +3,12 @@
 import os
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
-import pandas as pd
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Font, Alignment, PatternFill
-from openpyxl.utils.dataframe import dataframe_to_rows
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple
+
+# pandas and openpyxl are imported inside the methods that use them, so importing
+# this module stays cheap when resume tracking is disabled
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class ResumeTracker:
@@ -30,6 +31,14 @@ class ResumeTracker:
             worksheet_path: Path to the Excel file (relative or absolute)
         """
         self.worksheet_path = Path(worksheet_path)
+        # Data rows from the last read, keyed on the file's (mtime_ns, size)
+        self._rows: Optional[Tuple[tuple, ...]] = None
+        self._rows_key: Optional[Tuple[int, int]] = None
+        # Lowercased (company, role, date) and (company, role, page) keys of those rows
+        self._dedupe_keys: frozenset = frozenset()
+        self._url_keys: frozenset = frozenset()
+        # Set once the worksheet has been created or verified
+        self._ensured = False
         
     def ensure_worksheet_exists(self) -> bool:
         """
@@ -38,16 +47,21 @@ class ResumeTracker:
         Returns:
             bool: True if worksheet was created/verified successfully
         """
+        # Already verified by this tracker; only check the file is still there
+        if self._ensured and self.worksheet_path.exists():
+            return True
+        
         try:
             # Create directory if it doesn't exist
             self.worksheet_path.parent.mkdir(parents=True, exist_ok=True)
             
             if self.worksheet_path.exists() and self.worksheet_path.stat().st_size > 0:
                 # Verify existing file has correct headers
-                return self._verify_headers()
+                self._ensured = self._verify_headers()
             else:
                 # Create new worksheet
-                return self._create_new_worksheet()
+                self._ensured = self._create_new_worksheet()
+            return self._ensured
                 
         except Exception as e:
             print(f"Error ensuring worksheet exists: {str(e)}")
@@ -56,17 +70,15 @@ class ResumeTracker:
     def _create_new_worksheet(self) -> bool:
         """Create a new Excel worksheet with proper formatting"""
         try:
+            from openpyxl import Workbook
+            
             wb = Workbook()
             ws = wb.active
             ws.title = "Resume Applications"
             
             # Add headers
             for col_idx, header in enumerate(self.REQUIRED_COLUMNS, 1):
-                cell = ws.cell(row=1, column=col_idx, value=header)
-                # Header formatting
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center")
+                self._format_header_cell(ws.cell(row=1, column=col_idx, value=header))
             
             # Set column widths
             column_widths = {
@@ -83,6 +95,7 @@ class ResumeTracker:
             
             # Save workbook
             wb.save(self.worksheet_path)
+            self._rows = None
             print(f"Created new resume tracking worksheet: {self.worksheet_path}")
             return True
             
@@ -94,8 +107,7 @@ class ResumeTracker:
         """Verify existing worksheet has correct headers"""
         try:
             # Read first row to check headers
-            df = pd.read_excel(self.worksheet_path, nrows=1, engine='openpyxl')
-            existing_columns = list(df.columns)
+            existing_columns = [value for row in self._iter_rows(max_row=1, max_col=None) for value in row]
             
             # Check if all required columns exist
             missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in existing_columns]
@@ -115,6 +127,8 @@ class ResumeTracker:
     def _add_missing_columns(self, missing_columns: list) -> bool:
         """Add missing columns to existing worksheet"""
         try:
+            import pandas as pd
+            
             # Load existing data
             df = pd.read_excel(self.worksheet_path, engine='openpyxl')
             
@@ -168,59 +182,95 @@ class ResumeTracker:
             # Format application date
             formatted_date = application_date.strftime("%Y-%m-%d")
             
-            # Create record data
-            new_record = {
-                'Company': company,
-                'Department': department,
-                'Role': role,
-                'Salary': salary,
-                'Application Date': formatted_date,
-                'Application Page': application_page
-            }
+            # Load the workbook once for both the duplicate check and the insert
+            from openpyxl import load_workbook
+            
+            wb = load_workbook(self.worksheet_path)
+            ws = wb.active
             
             # Check if this exact record already exists (to avoid duplicates)
-            if self._record_exists(company, role, formatted_date):
+            existing_rows = ws.iter_rows(min_row=2, max_col=len(self.REQUIRED_COLUMNS), values_only=True)
+            dedupe_keys, _ = self._key_sets(existing_rows)
+            if self._record_exists(dedupe_keys, company, role, formatted_date):
                 print(f"Record already exists for {company} - {role} on {formatted_date}")
                 return True
             
-            # Load existing data
-            try:
-                df = pd.read_excel(self.worksheet_path, engine='openpyxl')
-            except Exception:
-                # If file is corrupted or empty, create empty DataFrame
-                df = pd.DataFrame(columns=self.REQUIRED_COLUMNS)
-            
-            # Add new record
-            new_row = pd.DataFrame([new_record])
-            df = pd.concat([df, new_row], ignore_index=True)
-            
-            # Sort by application date (newest first)
-            df['Application Date'] = pd.to_datetime(df['Application Date'])
-            df = df.sort_values('Application Date', ascending=False)
-            df['Application Date'] = df['Application Date'].dt.strftime('%Y-%m-%d')
-            
-            # Save back to Excel with formatting
-            self._save_formatted_excel(df)
+            # Keep the newest application first without re-sorting: current records go
+            # directly below the headers, backfilled dates above the first record not newer
+            insert_row = 2
+            for (existing_date,) in ws.iter_rows(min_row=2, min_col=5, max_col=5, values_only=True):
+                if self._cell_text(existing_date) <= formatted_date:
+                    break
+                insert_row += 1
+            
+            new_record = [company, department, role, salary, formatted_date, application_page]
+            ws.insert_rows(insert_row)
+            for col_idx, value in enumerate(new_record, 1):
+                ws.cell(row=insert_row, column=col_idx, value=value)
+            
+            wb.save(self.worksheet_path)
+            self._rows = None
             
             print(f"Added application record: {company} - {role}")
             return True
             
         except Exception as e:
             print(f"Error adding application record: {str(e)}")
+            # The write may have left the file unusable; verify it again next time
+            self._ensured = False
             return False
     
-    def _record_exists(self, company: str, role: str, application_date: str) -> bool:
-        """Check if a record with the same company, role, and date already exists"""
+    def _record_exists(self, dedupe_keys: frozenset, company: str, role: str, application_date: str) -> bool:
+        """Check if a record with the same company, role, and date already exists in the given keys"""
+        return (company.lower(), role.lower(), application_date) in dedupe_keys
+    
+    def _iter_rows(self, **kwargs):
+        """Yield worksheet rows as value tuples from a read-only workbook"""
+        from openpyxl import load_workbook
+        
+        wb = load_workbook(self.worksheet_path, read_only=True, data_only=True)
+        kwargs.setdefault('max_col', len(self.REQUIRED_COLUMNS))
         try:
-            df = pd.read_excel(self.worksheet_path, engine='openpyxl')
-            matching_records = df[
-                (df['Company'].str.lower() == company.lower()) & 
-                (df['Role'].str.lower() == role.lower()) &
-                (df['Application Date'] == application_date)
-            ]
-            return len(matching_records) > 0
-        except Exception:
-            return False
+            yield from wb.active.iter_rows(values_only=True, **kwargs)
+        finally:
+            wb.close()
+    
+    def _load_rows(self) -> Tuple[tuple, ...]:
+        """Return the data rows, re-reading the worksheet only when the file has changed"""
+        stat = self.worksheet_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._rows is None or self._rows_key != key:
+            self._rows = tuple(self._iter_rows(min_row=2))
+            # Build the duplicate lookup sets once per read rather than scanning on every check
+            self._dedupe_keys, self._url_keys = self._key_sets(self._rows)
+            self._rows_key = key
+        return self._rows
+    
+    def _load_key_sets(self) -> Tuple[frozenset, frozenset]:
+        """Return the dedupe and URL key sets for the current data rows"""
+        self._load_rows()
+        return self._dedupe_keys, self._url_keys
+    
+    @classmethod
+    def _key_sets(cls, rows) -> Tuple[frozenset, frozenset]:
+        """Return the (company, role, date) and (company, role, page) keys of rows, text lowercased"""
+        dedupe_keys = set()
+        url_keys = set()
+        for row in rows:
+            company = cls._cell_text(row[0]).lower()
+            role = cls._cell_text(row[2]).lower()
+            dedupe_keys.add((company, role, cls._cell_text(row[4])))
+            url_keys.add((company, role, cls._cell_text(row[5]).lower()))
+        return frozenset(dedupe_keys), frozenset(url_keys)
+    
+    @staticmethod
+    def _cell_text(value) -> str:
+        """Return a cell value as text, formatting dates the way records are written"""
+        if value is None:
+            return ""
+        if isinstance(value, datetime):
+            return value.strftime("%Y-%m-%d")
+        return str(value)
     
     def check_duplicate_resume(self, company: str, role: str, application_page: str = "") -> bool:
         """
@@ -238,70 +288,76 @@ class ResumeTracker:
             # Ensure worksheet exists first
             if not self.ensure_worksheet_exists():
                 return False
-                
-            df = pd.read_excel(self.worksheet_path, engine='openpyxl')
-            
-            if len(df) == 0:
-                return False  # No records exist yet
-            
-            # Check for exact company + role match
-            company_role_matches = df[
-                (df['Company'].str.lower() == company.lower()) & 
-                (df['Role'].str.lower() == role.lower())
-            ]
-            
-            # If we have an application page URL, check for exact URL match
-            if application_page and 'Application Page' in df.columns:
-                url_matches = company_role_matches[
-                    company_role_matches['Application Page'].str.lower() == application_page.lower()
-                ]
-                if len(url_matches) > 0:
-                    return True  # Found exact company + role + URL match
             
-            # If no URL provided or no URL match, check for company + role match from today
-            today = datetime.now().strftime("%Y-%m-%d")
-            recent_matches = company_role_matches[
-                company_role_matches['Application Date'] == today
-            ]
-            
-            return len(recent_matches) > 0
+            dedupe_keys, url_keys = self._load_key_sets()
+            return self._check_duplicate_resume(dedupe_keys, url_keys, company, role, application_page)
             
         except Exception as e:
             print(f"Error checking for duplicate resume: {str(e)}")
             return False  # If error occurs, allow generation to proceed
     
-    def _save_formatted_excel(self, df: pd.DataFrame):
+    def _check_duplicate_resume(self,
+                                dedupe_keys: frozenset,
+                                url_keys: frozenset,
+                                company: str,
+                                role: str,
+                                application_page: str = "") -> bool:
+        """Check already-loaded key sets for a company/role/URL duplicate"""
+        company_lower = company.lower()
+        role_lower = role.lower()
+        
+        # Exact company + role + URL match
+        if application_page and (company_lower, role_lower, application_page.lower()) in url_keys:
+            return True
+        
+        # Otherwise a company + role match from today
+        today = datetime.now().strftime("%Y-%m-%d")
+        return (company_lower, role_lower, today) in dedupe_keys
+    
+    def _save_formatted_excel(self, df: 'pd.DataFrame'):
         """Save DataFrame to Excel with proper formatting"""
         try:
-            # Load existing workbook to preserve formatting
-            if self.worksheet_path.exists():
+            from openpyxl import Workbook, load_workbook
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.utils.dataframe import dataframe_to_rows
+            
+            column_widths = [20, 15, 25, 12, 15, 40]  # Company, Department, Role, Salary, Date, Application Page
+            
+            if self._has_other_sheets():
+                # Rewrite the tracking sheet in place so the workbook's other sheets are kept
                 wb = load_workbook(self.worksheet_path)
                 ws = wb.active
                 
                 # Clear existing data (keep headers)
                 ws.delete_rows(2, ws.max_row)
                 
+                # Write data starting from row 2 (after headers)
+                for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=False), 2):
+                    for c_idx, value in enumerate(row, 1):
+                        ws.cell(row=r_idx, column=c_idx, value=value)
+                
+                # Ensure headers are formatted properly
+                for col_idx, header in enumerate(self.REQUIRED_COLUMNS, 1):
+                    self._format_header_cell(ws.cell(row=1, column=col_idx, value=header))
+                
+                for col_idx, width in enumerate(column_widths, 1):
+                    ws.column_dimensions[chr(64 + col_idx)].width = width
+                
             else:
-                wb = Workbook()
-                ws = wb.active
-                ws.title = "Resume Applications"
-            
-            # Write data starting from row 2 (after headers)
-            for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=False), 2):
-                for c_idx, value in enumerate(row, 1):
-                    ws.cell(row=r_idx, column=c_idx, value=value)
-            
-            # Ensure headers are formatted properly
-            for col_idx, header in enumerate(self.REQUIRED_COLUMNS, 1):
-                cell = ws.cell(row=1, column=col_idx, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center")
-            
-            # Set column widths
-            column_widths = [20, 15, 25, 12, 15, 40]  # Company, Department, Role, Salary, Date, Application Page
-            for col_idx, width in enumerate(column_widths, 1):
-                ws.column_dimensions[chr(64 + col_idx)].width = width
+                # Stream a fresh workbook in write-only mode instead of building every cell
+                wb = Workbook(write_only=True)
+                ws = wb.create_sheet("Resume Applications")
+                
+                # Column widths must be set before any rows are written
+                for col_idx, width in enumerate(column_widths, 1):
+                    ws.column_dimensions[chr(64 + col_idx)].width = width
+                
+                ws.append([
+                    self._format_header_cell(WriteOnlyCell(ws, value=header))
+                    for header in self.REQUIRED_COLUMNS
+                ])
+                for row in dataframe_to_rows(df, index=False, header=False):
+                    ws.append(row)
             
             # Save workbook
             wb.save(self.worksheet_path)
@@ -310,25 +366,58 @@ class ResumeTracker:
             print(f"Error saving formatted Excel: {str(e)}")
             # Fallback to simple DataFrame save
             df.to_excel(self.worksheet_path, index=False, engine='openpyxl')
+        finally:
+            self._rows = None
+    
+    def _has_other_sheets(self) -> bool:
+        """Check whether the existing workbook holds sheets besides the tracking sheet"""
+        if not self.worksheet_path.exists():
+            return False
+        
+        from openpyxl import load_workbook
+        
+        wb = load_workbook(self.worksheet_path, read_only=True)
+        try:
+            return len(wb.sheetnames) > 1
+        finally:
+            wb.close()
+    
+    @staticmethod
+    def _format_header_cell(cell):
+        """Apply the header style to a cell and return it"""
+        from openpyxl.styles import Font, Alignment, PatternFill
+        
+        cell.font = Font(bold=True, color="FFFFFF")
+        cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        cell.alignment = Alignment(horizontal="center")
+        return cell
     
     def get_application_stats(self) -> Dict[str, Any]:
         """Get statistics about applications"""
         try:
-            df = pd.read_excel(self.worksheet_path, engine='openpyxl')
-            
-            total_applications = len(df)
-            companies_applied = df['Company'].nunique()
-            roles_applied = df['Role'].nunique()
-            
-            # Applications this month
-            df['Application Date'] = pd.to_datetime(df['Application Date'])
-            current_month = datetime.now().replace(day=1)
-            this_month_applications = len(df[df['Application Date'] >= current_month])
+            total_applications = 0
+            companies = set()
+            roles = set()
+            this_month_applications = 0
+            # Dates are stored as YYYY-MM-DD, so they compare correctly as text
+            current_month = datetime.now().strftime("%Y-%m-01")
+            
+            for row in self._load_rows():
+                if all(value is None for value in row):
+                    continue  # Skip blank rows
+                
+                total_applications += 1
+                if row[0] is not None:
+                    companies.add(row[0])
+                if row[2] is not None:
+                    roles.add(row[2])
+                if self._cell_text(row[4]) >= current_month:
+                    this_month_applications += 1
             
             return {
                 'total_applications': total_applications,
-                'companies_applied': companies_applied,
-                'roles_applied': roles_applied,
+                'companies_applied': len(companies),
+                'roles_applied': len(roles),
                 'this_month_applications': this_month_applications,
                 'worksheet_path': str(self.worksheet_path)
             }
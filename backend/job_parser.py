@@ -1,11 +1,140 @@
 """Job description parsing utilities for Resume Automation System"""
 
+import hashlib
 import re
+from collections import OrderedDict
 from typing import Dict, Optional, Tuple
 from urllib.parse import urlparse
 import requests
 from bs4 import BeautifulSoup
 
+try:
+    # The lexbor backend; selectolax 1.0 made the older selectolax.parser module raise on import
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+# Precompiled patterns for the parsing hot path
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_TITLE_TAG_RE = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+_HAS_LETTER_RE = re.compile(r'[a-zA-Z]')
+
+_WWW_PREFIX_RE = re.compile(r'^www\.')
+_SUBDOMAIN_RE = re.compile(r'([^.]+)\.')
+_DOMAIN_SUFFIX_RE = re.compile(r'(labs?|inc|corp|llc|ltd)$', re.IGNORECASE)
+
+# Common job board title formats, in the order they are tried
+_TITLE_FORMAT_RES = [
+    # "Company Name - Job Title" (lever.co, greenhouse.io, etc.)
+    re.compile(r'^([^-]+?)\s*[-–—]\s*(.+?)(?:\s*[-–—].*)?$', re.IGNORECASE),
+    # "Job Title at Company Name"
+    re.compile(r'^(.+?)\s+at\s+([^|]+?)(?:\s*[|].*)?$', re.IGNORECASE),
+    # "Job Title | Company Name"
+    re.compile(r'^(.+?)\s*[|]\s*([^|]+?)(?:\s*[|].*)?$', re.IGNORECASE),
+    # "Company: Job Title"
+    re.compile(r'^([^:]+?):\s*(.+?)(?:\s*[-–—].*)?$', re.IGNORECASE),
+]
+_CITY_STATE_RE = re.compile(r'^[A-Za-z\s]+,\s*[A-Za-z\s]+$')
+
+_POSITION_SUFFIX_RES = [
+    re.compile(r'\s*[-–—]\s*.*(?:jobs?|careers?|hiring|apply|remote|onsite).*$', re.IGNORECASE),
+    re.compile(r'\s*[|]\s*.*(?:jobs?|careers?).*$', re.IGNORECASE),
+]
+
+# Look for common title indicators at the beginning of text
+_TITLE_INDICATOR_RES = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in [
+        r'^([^.!?\n]{10,60}(?:Engineer|Manager|Developer|Analyst|Scientist|Lead|Director|VP|CTO))',
+        r'Position:\s*([^.!?\n]{5,60})',
+        r'Role:\s*([^.!?\n]{5,60})',
+        r'Job Title:\s*([^.!?\n]{5,60})',
+        r'We are looking for (?:a|an)\s+([^.!?\n]{5,60}(?:Engineer|Manager|Developer|Analyst|Scientist))',
+    ]
+]
+
+# Common company indicators; the text searched has its whitespace normalized,
+# so MULTILINE only matters for the anchored patterns at the very start
+_COMPANY_RES = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in [
+        # Company introductions
+        r'(?:About|Join|At)\s+([A-Z][a-zA-Z0-9\s&.,()-]{2,40})(?:\s*[,.:]|\s*$)',
+        r'Company:\s*([A-Za-z0-9][a-zA-Z0-9\s&.,()-]{1,40})',
+        r'Organization:\s*([A-Za-z0-9][a-zA-Z0-9\s&.,()-]{1,40})',
+        
+        # Company mentions
+        r'([A-Z][a-zA-Z0-9\s&.,()-]{2,40})\s+is\s+(?:looking for|seeking|hiring|a leading|an?)',
+        r'Join\s+(?:the\s+team\s+at\s+)?([A-Z][a-zA-Z0-9\s&.,()-]{2,40})',
+        r'Work\s+(?:at|with)\s+([A-Z][a-zA-Z0-9\s&.,()-]{2,40})',
+        
+        # Job board patterns
+        r'Apply\s+to\s+([A-Z][a-zA-Z0-9\s&.,()-]{2,40})',
+        r'Career\s+(?:opportunity\s+)?at\s+([A-Z][a-zA-Z0-9\s&.,()-]{2,40})',
+        
+        # Direct mentions
+        r'^([A-Z][a-zA-Z0-9\s&.,()-]{2,40})\s+(?:is|seeks|wants|needs)',
+    ]
+]
+# Company mentions past this many characters are rarely the hiring company
+_COMPANY_SEARCH_WINDOW = 4000
+_COMPANY_PREFIX_RE = re.compile(r'^(?:the\s+)?', re.IGNORECASE)
+_COMPANY_SUFFIX_RE = re.compile(r'\s*(?:inc\.?|llc\.?|corp\.?|ltd\.?|co\.?)\s*$', re.IGNORECASE)
+
+# Common false positives for company names
+_FALSE_POSITIVE_COMPANIES = frozenset({
+    'this', 'the', 'we', 'you', 'our', 'your', 'all', 'some', 'many', 'most', 
+    'key', 'main', 'primary', 'current', 'new', 'next', 'first', 'last',
+    'position', 'role', 'job', 'career', 'opportunity', 'team', 'company',
+    'organization', 'department', 'division', 'group', 'candidate', 'applicant',
+    'engineering', 'software', 'technology', 'technical', 'senior', 'junior',
+    'full time', 'part time', 'remote', 'onsite', 'hybrid'
+})
+
+# Subdomains that name the careers site rather than the company
+_GENERIC_SUBDOMAINS = frozenset({'www', 'jobs', 'careers', 'hire', 'apply', 'ats'})
+
+# Position title keywords for resume template selection
+_SENIOR_ENGINEERING_MANAGER_KEYWORDS = (
+    'senior engineering manager', 'senior eng manager', 'engineering director', 
+    'director of engineering', 'vp engineering', 'head of engineering',
+    'senior director engineering', 'principal engineering manager'
+)
+_DATA_ENGINEERING_MANAGER_KEYWORDS = (
+    'data engineering manager', 'data eng manager', 'manager data engineering',
+    'manager, data engineer', 'manager, data engineering',  # Comma-separated formats
+    'head of data engineering', 'director data engineering', 'data platform manager',
+    'analytics engineering manager', 'data infrastructure manager'
+)
+_ENGINEERING_MANAGER_KEYWORDS = (
+    'engineering manager', 'eng manager', 'software engineering manager',
+    'software eng manager', 'team lead', 'tech lead manager', 'development manager',
+    'manager, software development', 'software development manager',
+    'manager software', 'technical manager', 'engineering lead'
+)
+_MANAGER_AREA_KEYWORDS = ('software development', 'software engineering', 'engineering', 'development')
+_SENIOR_SOFTWARE_ENGINEER_KEYWORDS = (
+    'senior software engineer', 'senior engineer', 'staff engineer', 
+    'principal engineer', 'senior developer', 'lead engineer',
+    'senior data engineer', 'senior backend engineer', 'senior frontend engineer',
+    'senior full stack engineer', 'senior platform engineer', 'senior sre',
+    'senior devops engineer', 'senior software developer'
+)
+_ENGINEER_KEYWORDS = (
+    'software engineer', 'engineer', 'developer', 'programmer',
+    'data engineer', 'backend engineer', 'frontend engineer',
+    'full stack', 'platform engineer', 'devops', 'sre'
+)
+
+
+def _html_to_text(html: str) -> str:
+    """Strip HTML tags and normalize whitespace, using selectolax's C parser when installed"""
+    if HTMLParser is not None:
+        # Join text nodes directly, as the regex does, so inline markup like $<span>150</span>K stays intact
+        clean_text = HTMLParser(html).text(separator='')
+    else:
+        clean_text = _HTML_TAG_RE.sub('', html)  # Remove HTML tags
+    return _WHITESPACE_RE.sub(' ', clean_text)  # Normalize whitespace
+
 
 class JobParser:
     """Parses job descriptions to extract company name and position title"""
@@ -75,7 +204,11 @@ class JobParser:
         }
     }
     
-    # Common position title patterns
+    # Parsed postings kept for repeat submissions, least recently used evicted first
+    PARSE_CACHE_SIZE = 256
+    _parse_cache: 'OrderedDict[Tuple[bytes, Optional[str]], Dict[str, Optional[str]]]' = OrderedDict()
+    
+    # Common position title patterns (literal phrases, checked in order of priority)
     POSITION_PATTERNS = [
         # Engineering roles
         r'Senior Software Engineer',
@@ -125,6 +258,12 @@ class JobParser:
         r'Full Stack Engineer',
         r'Full-Stack Engineer',
     ]
+    _POSITION_LITERALS = [pattern.lower() for pattern in POSITION_PATTERNS]
+    _POSITION_RES = [re.compile(pattern, re.IGNORECASE) for pattern in POSITION_PATTERNS]
+    _JOB_BOARD_COMPANY_RES = {
+        job_board: re.compile(patterns['company_pattern'], re.IGNORECASE)
+        for job_board, patterns in JOB_BOARD_PATTERNS.items()
+    }
     
     @classmethod
     def extract_from_url(cls, url: str) -> Tuple[Optional[str], Optional[str]]:
@@ -134,16 +273,16 @@ class JobParser:
             domain = parsed_url.netloc
             
             # Remove www prefix
-            domain = re.sub(r'^www\.', '', domain)
+            domain = _WWW_PREFIX_RE.sub('', domain)
             
             # Check direct company domains
             if domain in cls.COMPANY_DOMAINS:
                 return cls.COMPANY_DOMAINS[domain], None
             
             # Check job board patterns
-            for job_board, patterns in cls.JOB_BOARD_PATTERNS.items():
+            for job_board, company_re in cls._JOB_BOARD_COMPANY_RES.items():
                 if job_board in domain:
-                    company_match = re.search(patterns['company_pattern'], url, re.IGNORECASE)
+                    company_match = company_re.search(url)
                     if company_match:
                         from urllib.parse import unquote
                         company = unquote(company_match.group(1))  # URL decode
@@ -154,10 +293,10 @@ class JobParser:
                         return company.title(), None
             
             # Try to extract company from subdomain
-            subdomain_match = re.match(r'([^.]+)\.', domain)
+            subdomain_match = _SUBDOMAIN_RE.match(domain)
             if subdomain_match:
                 subdomain = subdomain_match.group(1)
-                if subdomain not in ['www', 'jobs', 'careers', 'hire', 'apply', 'ats']:
+                if subdomain not in _GENERIC_SUBDOMAINS:
                     return subdomain.replace('-', ' ').title(), None
             
             # If subdomain extraction failed, try extracting from root domain
@@ -169,7 +308,7 @@ class JobParser:
                 if company_name in ['toasttab']:
                     return 'Toast', None
                 # Clean up common domain artifacts only if they're clearly suffixes
-                company_name = re.sub(r'(labs?|inc|corp|llc|ltd)$', '', company_name, flags=re.IGNORECASE).strip()
+                company_name = _DOMAIN_SUFFIX_RE.sub('', company_name).strip()
                 if company_name and len(company_name) > 2:  # Must be reasonable length
                     return company_name.replace('-', ' ').title(), None
         except Exception as e:
@@ -184,7 +323,7 @@ class JobParser:
         position = None
         
         # First try to extract from HTML title tag if present (most reliable for job boards)
-        title_match = re.search(r'<title[^>]*>([^<]+)</title>', job_description, re.IGNORECASE)
+        title_match = _TITLE_TAG_RE.search(job_description)
         if title_match:
             title_content = title_match.group(1).strip()
             
@@ -197,8 +336,7 @@ class JobParser:
         
         # Clean job description for parsing if we still need company or position
         if not company or not position:
-            clean_text = re.sub(r'<[^>]+>', '', job_description)  # Remove HTML tags
-            clean_text = re.sub(r'\s+', ' ', clean_text)  # Normalize whitespace
+            clean_text = _html_to_text(job_description)
             
             # Extract from content if not found in title
             if not company:
@@ -223,33 +361,21 @@ class JobParser:
         company = None
         position = None
         
-        # Common job board title formats
-        title_patterns = [
-            # "Company Name - Job Title" (lever.co, greenhouse.io, etc.)
-            r'^([^-]+?)\s*[-–—]\s*(.+?)(?:\s*[-–—].*)?$',
-            # "Job Title at Company Name"
-            r'^(.+?)\s+at\s+([^|]+?)(?:\s*[|].*)?$',
-            # "Job Title | Company Name"
-            r'^(.+?)\s*[|]\s*([^|]+?)(?:\s*[|].*)?$',
-            # "Company: Job Title"
-            r'^([^:]+?):\s*(.+?)(?:\s*[-–—].*)?$'
-        ]
-        
-        for pattern in title_patterns:
-            match = re.match(pattern, title_content.strip(), re.IGNORECASE)
+        for format_index, pattern in enumerate(_TITLE_FORMAT_RES):
+            match = pattern.match(title_content.strip())
             if match:
                 part1, part2 = match.groups()
                 part1 = part1.strip()
                 part2 = part2.strip()
                 
                 # For "Company - Position" format (most common)
-                if pattern == title_patterns[0]:
+                if format_index == 0:
                     # Check if part2 looks like a location instead of a job title
                     # Common location patterns: "Remote", "City, State", "City, Country"
                     location_indicators = ['remote', 'onsite', 'hybrid', 'united states', 'usa', 'us', 'uk', 'canada']
                     is_location = (
                         any(indicator in part2.lower() for indicator in location_indicators) or
-                        re.search(r'^[A-Za-z\s]+,\s*[A-Za-z\s]+$', part2)  # "City, State" format
+                        _CITY_STATE_RE.search(part2)  # "City, State" format
                     )
                     
                     if is_location:
@@ -264,15 +390,15 @@ class JobParser:
                         company = cls._clean_company_name(part1)
                         position = cls._clean_position_title(part2)
                 # For "Position at Company" format
-                elif pattern == title_patterns[1]:
+                elif format_index == 1:
                     position = cls._clean_position_title(part1)
                     company = cls._clean_company_name(part2)
                 # For "Position | Company" format
-                elif pattern == title_patterns[2]:
+                elif format_index == 2:
                     position = cls._clean_position_title(part1)
                     company = cls._clean_company_name(part2)
                 # For "Company: Position" format
-                elif pattern == title_patterns[3]:
+                elif format_index == 3:
                     company = cls._clean_company_name(part1)
                     position = cls._clean_position_title(part2)
                 
@@ -297,14 +423,14 @@ class JobParser:
             return None
             
         # Remove common suffixes/prefixes that aren't part of the actual position
-        position = re.sub(r'\s*[-–—]\s*.*(?:jobs?|careers?|hiring|apply|remote|onsite).*$', '', position, flags=re.IGNORECASE)
-        position = re.sub(r'\s*[|]\s*.*(?:jobs?|careers?).*$', '', position, flags=re.IGNORECASE)
+        for suffix_re in _POSITION_SUFFIX_RES:
+            position = suffix_re.sub('', position)
         position = position.strip(' .,;:-')
         
         # Check reasonable length and format
         if 5 <= len(position) <= 80 and not position.isdigit():
             # Must contain at least one letter
-            if re.search(r'[a-zA-Z]', position):
+            if _HAS_LETTER_RE.search(position):
                 return position
         
         return None
@@ -313,22 +439,23 @@ class JobParser:
     def _extract_position_title(cls, text: str) -> Optional[str]:
         """Extract position title from job description text"""
         # Look for position patterns in order of specificity
-        for pattern in cls.POSITION_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
+        # The patterns are literal phrases, so searching the lowercased text once per
+        # pattern with str.find gives the same first match as a case-insensitive regex
+        text_lower = text.lower()
+        same_length = len(text_lower) == len(text)
+        for literal, pattern in zip(cls._POSITION_LITERALS, cls._POSITION_RES):
+            start = text_lower.find(literal)
+            if start != -1:
+                if same_length:
+                    return text[start:start + len(literal)]
+                # Lowercasing changed some character widths; take the match from the original text
+                match = pattern.search(text)
+                if match:
+                    return match.group(0)
         
         # Look for common title indicators at the beginning of text
-        title_indicators = [
-            r'^([^.!?\n]{10,60}(?:Engineer|Manager|Developer|Analyst|Scientist|Lead|Director|VP|CTO))',
-            r'Position:\s*([^.!?\n]{5,60})',
-            r'Role:\s*([^.!?\n]{5,60})',
-            r'Job Title:\s*([^.!?\n]{5,60})',
-            r'We are looking for (?:a|an)\s+([^.!?\n]{5,60}(?:Engineer|Manager|Developer|Analyst|Scientist))',
-        ]
-        
-        for pattern in title_indicators:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _TITLE_INDICATOR_RES:
+            match = pattern.search(text)
             if match:
                 title = match.group(1).strip()
                 if 5 <= len(title) <= 60:  # Reasonable title length
@@ -339,41 +466,20 @@ class JobParser:
     @classmethod
     def _extract_company_name(cls, text: str) -> Optional[str]:
         """Extract company name from job description text"""
-        # Look for common company indicators with better patterns  
-        company_patterns = [
-            # Company introductions
-            r'(?:About|Join|At)\s+([A-Z][a-zA-Z0-9\s&.,()-]{2,40})(?:\s*[,.:]|\s*$)',
-            r'Company:\s*([A-Za-z0-9][a-zA-Z0-9\s&.,()-]{1,40})',
-            r'Organization:\s*([A-Za-z0-9][a-zA-Z0-9\s&.,()-]{1,40})',
-            
-            # Company mentions
-            r'([A-Z][a-zA-Z0-9\s&.,()-]{2,40})\s+is\s+(?:looking for|seeking|hiring|a leading|an?)',
-            r'Join\s+(?:the\s+team\s+at\s+)?([A-Z][a-zA-Z0-9\s&.,()-]{2,40})',
-            r'Work\s+(?:at|with)\s+([A-Z][a-zA-Z0-9\s&.,()-]{2,40})',
-            
-            # Job board patterns
-            r'Apply\s+to\s+([A-Z][a-zA-Z0-9\s&.,()-]{2,40})',
-            r'Career\s+(?:opportunity\s+)?at\s+([A-Z][a-zA-Z0-9\s&.,()-]{2,40})',
-            
-            # Direct mentions
-            r'^([A-Z][a-zA-Z0-9\s&.,()-]{2,40})\s+(?:is|seeks|wants|needs)',
-        ]
-        
         # First try to get from the beginning of the text (most reliable)
         first_200_chars = text[:200]
         
-        for pattern in company_patterns:
-            matches = re.findall(pattern, first_200_chars, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                company = cls._clean_company_name(match.strip())
+        for pattern in _COMPANY_RES:
+            for match in pattern.finditer(first_200_chars):
+                company = cls._clean_company_name(match.group(1).strip())
                 if company:
                     return company
         
-        # If not found in first part, search the full text
-        for pattern in company_patterns[1:]:  # Skip first pattern for full text search
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                company = cls._clean_company_name(match.strip())
+        # If not found in first part, search a bounded window of the text
+        search_window = text[:_COMPANY_SEARCH_WINDOW]
+        for pattern in _COMPANY_RES[1:]:  # Skip first pattern for the wider search
+            for match in pattern.finditer(search_window):
+                company = cls._clean_company_name(match.group(1).strip())
                 if company:
                     return company
         
@@ -386,27 +492,18 @@ class JobParser:
             return None
             
         # Remove common prefixes/suffixes
-        company = re.sub(r'^(?:the\s+)?', '', company, flags=re.IGNORECASE)
-        company = re.sub(r'\s*(?:inc\.?|llc\.?|corp\.?|ltd\.?|co\.?)\s*$', '', company, flags=re.IGNORECASE)
+        company = _COMPANY_PREFIX_RE.sub('', company)
+        company = _COMPANY_SUFFIX_RE.sub('', company)
         company = company.strip(' .,;:-')
         
         # Filter out common false positives
-        false_positives = [
-            'this', 'the', 'we', 'you', 'our', 'your', 'all', 'some', 'many', 'most', 
-            'key', 'main', 'primary', 'current', 'new', 'next', 'first', 'last',
-            'position', 'role', 'job', 'career', 'opportunity', 'team', 'company',
-            'organization', 'department', 'division', 'group', 'candidate', 'applicant',
-            'engineering', 'software', 'technology', 'technical', 'senior', 'junior',
-            'full time', 'part time', 'remote', 'onsite', 'hybrid'
-        ]
-        
-        if company.lower() in false_positives:
+        if company.lower() in _FALSE_POSITIVE_COMPANIES:
             return None
         
         # Check reasonable length and format
         if 2 <= len(company) <= 50 and not company.isdigit():
             # Must contain at least one letter
-            if re.search(r'[a-zA-Z]', company):
+            if _HAS_LETTER_RE.search(company):
                 return company
         
         return None
@@ -420,52 +517,27 @@ class JobParser:
         position_lower = position_title.lower()
         
         # Senior Engineering Manager patterns
-        if any(pattern in position_lower for pattern in [
-            'senior engineering manager', 'senior eng manager', 'engineering director', 
-            'director of engineering', 'vp engineering', 'head of engineering',
-            'senior director engineering', 'principal engineering manager'
-        ]):
+        if any(pattern in position_lower for pattern in _SENIOR_ENGINEERING_MANAGER_KEYWORDS):
             return 'senior_engineering_manager'
         
         # Data Engineering Manager patterns
-        elif any(pattern in position_lower for pattern in [
-            'data engineering manager', 'data eng manager', 'manager data engineering',
-            'manager, data engineer', 'manager, data engineering',  # Comma-separated formats
-            'head of data engineering', 'director data engineering', 'data platform manager',
-            'analytics engineering manager', 'data infrastructure manager'
-        ]):
+        elif any(pattern in position_lower for pattern in _DATA_ENGINEERING_MANAGER_KEYWORDS):
             return 'data_engineering_manager'
         
         # General Engineering Manager patterns (broader match)
-        elif any(pattern in position_lower for pattern in [
-            'engineering manager', 'eng manager', 'software engineering manager',
-            'software eng manager', 'team lead', 'tech lead manager', 'development manager',
-            'manager, software development', 'software development manager',
-            'manager software', 'technical manager', 'engineering lead'
-        ]) or any(
+        elif any(pattern in position_lower for pattern in _ENGINEERING_MANAGER_KEYWORDS) or (
             # Handle numbered manager positions like "Manager 1, Software Development"
-            ('manager' in position_lower and pattern in position_lower) for pattern in [
-                'software development', 'software engineering', 'engineering', 'development'
-            ]
+            'manager' in position_lower and
+            any(pattern in position_lower for pattern in _MANAGER_AREA_KEYWORDS)
         ):
             return 'engineering_manager'
         
         # Senior Software Engineer patterns (for individual contributor roles)
-        elif any(pattern in position_lower for pattern in [
-            'senior software engineer', 'senior engineer', 'staff engineer', 
-            'principal engineer', 'senior developer', 'lead engineer',
-            'senior data engineer', 'senior backend engineer', 'senior frontend engineer',
-            'senior full stack engineer', 'senior platform engineer', 'senior sre',
-            'senior devops engineer', 'senior software developer'
-        ]):
+        elif any(pattern in position_lower for pattern in _SENIOR_SOFTWARE_ENGINEER_KEYWORDS):
             return 'senior_software_engineer'
         
         # Default to senior software engineer for other engineering roles
-        elif any(pattern in position_lower for pattern in [
-            'software engineer', 'engineer', 'developer', 'programmer',
-            'data engineer', 'backend engineer', 'frontend engineer',
-            'full stack', 'platform engineer', 'devops', 'sre'
-        ]):
+        elif any(pattern in position_lower for pattern in _ENGINEER_KEYWORDS):
             return 'senior_software_engineer'
         
         # No match found
@@ -653,9 +725,9 @@ class JobParser:
         if not job_description:
             return "TBD"
         
-        # Clean HTML tags for text analysis
-        clean_text = re.sub(r'<[^>]+>', '', job_description)
-        clean_text = re.sub(r'\s+', ' ', clean_text)
+        # Clean HTML tags for text analysis; always with the regex, since selectolax decodes
+        # entities like &ndash; that the salary patterns would then match differently
+        clean_text = _WHITESPACE_RE.sub(' ', _HTML_TAG_RE.sub('', job_description))
         
         # Salary patterns - ordered from most specific to least specific
         salary_patterns = [
@@ -867,6 +939,31 @@ class JobParser:
     @classmethod
     def parse_job_posting(cls, job_description: str, url: str = None) -> Dict[str, Optional[str]]:
         """Main method to parse job posting and return extracted information"""
+        # Retries and re-generation resubmit the same posting, so reuse earlier results
+        # keyed on a digest of the content rather than the full text
+        cache_key = (hashlib.blake2b(job_description.encode('utf-8'), digest_size=16).digest(), url)
+        cached = cls._parse_cache.get(cache_key)
+        if cached is not None:
+            cls._parse_cache.move_to_end(cache_key)
+            return dict(cached)
+        
+        result, cacheable = cls._parse_job_posting(job_description, url)
+        if cacheable:
+            cls._parse_cache[cache_key] = result
+            if len(cls._parse_cache) > cls.PARSE_CACHE_SIZE:
+                cls._parse_cache.popitem(last=False)
+        return dict(result)
+    
+    @classmethod
+    def _parse_job_posting(cls, job_description: str, url: str = None) -> Tuple[Dict[str, Optional[str]], bool]:
+        """
+        Run the full extraction pipeline for a job posting
+        
+        Returns:
+            The parsed fields, and whether they may be cached. A SPA salary lookup that
+            found nothing may have hit a network failure, so a retry must run it again.
+        """
+        cacheable = True
         company, position = cls.extract_from_content(job_description, url)
         
         # If position not found and we have a URL, try extracting from URL path
@@ -893,6 +990,7 @@ class JobParser:
                 print(f"✅ Found salary in SPA data: {salary}")
             else:
                 print(f"❌ No salary found in SPA data")
+                cacheable = False
         
         # Auto-select resume template based on position
         suggested_template = cls.select_resume_template(position) if position else None
@@ -910,4 +1008,4 @@ class JobParser:
             'suggested_template': suggested_template,
             'template_source': template_source,
             'confidence': confidence
-        }
\ No newline at end of file
+        }, cacheable
\ No newline at end of file
@@ -78,7 +78,7 @@ app.mount("/static", StaticFiles(directory="frontend"), name="static")
 
 # Initialize services
 config = get_config()
-client = anthropic.Anthropic(api_key=config.get('anthropic.api_key'))
+client = anthropic.Anthropic(api_key=config.resolved.anthropic_api_key)
 drive_manager = None  # Initialize on first use to handle missing credentials gracefully
 
 class EnabledPrompts(BaseModel):
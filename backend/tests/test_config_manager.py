@@ -0,0 +1,139 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports when run directly
+if __name__ == "__main__":
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from backend import config_manager
+from backend.config_manager import ConfigManager
+
+
+CONFIG_TEMPLATE = """anthropic:
+  api_key: ${TEST_ANTHROPIC_API_KEY}
+google_drive:
+  service_account_file: "service_account.json"
+  templates_folder_id: "templates-id"
+  output_folder_id: "output-id"
+  baseline_resumes:
+    engineering_manager: "Engineering Manager"
+prompts_file: "prompts.yaml"
+file_organization:
+  folder_structure: "$5 {company_name} - {position_title}/"
+"""
+
+PROMPTS_TEMPLATE = """prompt_1: "Resume {job_description}"
+prompt_2: "Cover letter"
+prompt_3: "Interview prep"
+"""
+
+
+class TestConfigManager:
+    """Test configuration loading, env substitution and prompt caching."""
+
+    @pytest.fixture
+    def config_path(self, tmp_path, monkeypatch):
+        """Write a minimal config and prompts file and return the config path."""
+        monkeypatch.setenv('TEST_ANTHROPIC_API_KEY', 'sk-test')
+        (tmp_path / 'prompts.yaml').write_text(PROMPTS_TEMPLATE, encoding='utf-8')
+        config_file = tmp_path / 'config.yaml'
+        config_file.write_text(CONFIG_TEMPLATE, encoding='utf-8')
+        return config_file
+
+    def test_module_import_does_not_load_config(self):
+        """Importing the module must not require a config.yaml to exist."""
+        assert hasattr(config_manager, 'get_config')
+
+        print("✅ config_manager imports without loading config.yaml")
+
+    def test_env_vars_substituted(self, config_path):
+        """Test ${VAR} placeholders are replaced while other $ text is kept."""
+        cfg = ConfigManager(str(config_path))
+
+        assert cfg.get('anthropic.api_key') == 'sk-test'
+        assert cfg.get('file_organization.folder_structure').startswith('$5 ')
+        assert cfg.get('google_drive.missing.key', 'default') == 'default'
+        assert cfg.resolved.anthropic_api_key == 'sk-test'
+        assert cfg.resolved.drive_output_folder_id == 'output-id'
+        assert cfg.get_baseline_resume_mapping() == {'engineering_manager': 'Engineering Manager'}
+        assert cfg.get_system_config() == {}
+
+        with pytest.raises(TypeError):
+            cfg.get_drive_config()['output_folder_id'] = 'changed'
+
+        print("✅ Environment variables substituted correctly")
+
+    def test_missing_required_key(self, config_path):
+        """Test validation reports the dotted name of a missing key."""
+        config_path.write_text(CONFIG_TEMPLATE.replace('  output_folder_id: "output-id"\n', ''), encoding='utf-8')
+
+        with pytest.raises(ValueError, match='google_drive.output_folder_id'):
+            ConfigManager(str(config_path))
+
+        print("✅ Missing required key reported")
+
+    def test_empty_config_reports_missing_key(self, config_path):
+        """Test an empty config file fails validation instead of crashing."""
+        config_path.write_text('', encoding='utf-8')
+
+        with pytest.raises(ValueError, match='anthropic.api_key'):
+            ConfigManager(str(config_path))
+
+        print("✅ Empty config reported as missing keys")
+
+    def test_prompts_cached_until_reload(self, config_path):
+        """Test prompts are parsed once and refreshed by reload()."""
+        cfg = ConfigManager(str(config_path))
+        prompts_file = config_path.parent / 'prompts.yaml'
+
+        assert cfg.get_prompt('prompt_2') == 'Cover letter'
+
+        prompts_file.write_text(PROMPTS_TEMPLATE.replace('Cover letter', 'Updated letter'), encoding='utf-8')
+        assert cfg.get_prompt('prompt_2') == 'Cover letter'  # Still served from cache
+
+        cfg.reload()
+        assert cfg.get_prompt('prompt_2') == 'Updated letter'
+
+        print("✅ Prompts cached and refreshed on reload")
+
+    def test_reload_picks_up_changed_env_vars(self, config_path, monkeypatch):
+        """Test reload() re-substitutes ${VAR} values even when the config file is unchanged."""
+        cfg = ConfigManager(str(config_path))
+        monkeypatch.setenv('TEST_ANTHROPIC_API_KEY', 'sk-rotated')
+
+        cfg.reload()
+
+        assert cfg.get('anthropic.api_key') == 'sk-rotated'
+        assert cfg.resolved.anthropic_api_key == 'sk-rotated'
+
+        print("✅ Changed environment variables picked up on reload")
+
+    def test_reload_skips_unchanged_config_without_env_vars(self, config_path, monkeypatch):
+        """Test reload() keeps the loaded config when the file has no ${VAR} and is unchanged."""
+        config_path.write_text(CONFIG_TEMPLATE.replace('${TEST_ANTHROPIC_API_KEY}', 'sk-literal'), encoding='utf-8')
+        cfg = ConfigManager(str(config_path))
+        config = cfg.config
+
+        cfg.reload()
+
+        assert cfg.config is config
+
+        print("✅ Unchanged config skipped on reload")
+
+    def test_yaml_sidecar_cache(self, config_path):
+        """Test plain YAML is cached as JSON and configs with ${VAR} are not."""
+        ConfigManager(str(config_path))
+        prompts_cache = config_path.parent / 'prompts.yaml.cache.json'
+
+        assert prompts_cache.exists()
+        assert not (config_path.parent / 'config.yaml.cache.json').exists()
+
+        cfg = ConfigManager(str(config_path))
+        assert cfg.get_prompt('prompt_3') == 'Interview prep'
+
+        print("✅ Sidecar cache written for plain YAML only")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -10,7 +10,9 @@ from docxtpl import DocxTemplate
 if __name__ == "__main__":
     sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from backend.docx_utils import tag_based_template_replacement, extract_template_tags
+from backend.docx_utils import (
+    tag_based_template_replacement, extract_template_tags, smart_content_replacement, _load_template_bytes
+)
 
 
 class TestDocxTemplate:
@@ -192,6 +194,53 @@ Jerry Mindek"""
             assert success, "Should succeed even with missing tags"
             
             print("✅ Handled missing template tags gracefully")
+    
+    def test_cached_template_rendered_twice(self):
+        """Test a cached template renders independently each time it is reused."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            template_path = Path(temp_dir) / "test_template.docx"
+            self.create_test_template_with_docxtpl(template_path)
+            
+            hits = _load_template_bytes.cache_info().hits
+            for company in ("DataCorp Solutions", "TestCorp Inc"):
+                output_path = Path(temp_dir) / f"{company}.docx"
+                tag_values = {'company': company, 'role': 'Lead Data Engineer', 'content': 'Dear Hiring Manager,'}
+                
+                assert tag_based_template_replacement(template_path, output_path, tag_values)
+                
+                output_text = '\n'.join(paragraph.text for paragraph in Document(output_path).paragraphs)
+                assert company in output_text
+                assert '{{company}}' not in output_text
+            
+            # The second render read the template from the cache
+            assert _load_template_bytes.cache_info().hits == hits + 1
+            assert 'DataCorp Solutions' not in '\n'.join(
+                paragraph.text for paragraph in Document(Path(temp_dir) / "TestCorp Inc.docx").paragraphs
+            )
+            
+            print("✅ Cached template rendered twice")
+    
+    def test_smart_replacement_body_lines_plain(self):
+        """Test body lines written over styled template runs come out without that styling."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_path = Path(temp_dir) / "source.docx"
+            dest_path = Path(temp_dir) / "dest.docx"
+            
+            doc = Document()
+            heading = doc.add_paragraph().add_run("Professional Summary")
+            heading.bold = True
+            heading.italic = True
+            doc.add_paragraph("Old summary")
+            doc.save(source_path)
+            
+            assert smart_content_replacement(source_path, dest_path, "Led a team of 6 engineers\nSKILLS:")
+            
+            body, header = Document(dest_path).paragraphs[:2]
+            assert body.text == "Led a team of 6 engineers"
+            assert body.runs[0].bold is None and body.runs[0].italic is None
+            assert header.text == "SKILLS:" and header.runs[0].bold
+            
+            print("✅ Body lines written without template run styling")
 
 
 if __name__ == "__main__":
@@ -201,4 +250,6 @@ if __name__ == "__main__":
     test.test_extract_template_tags_with_brackets()  
     test.test_docx_template_replacement_integration()
     test.test_tag_replacement_with_missing_tags()
+    test.test_cached_template_rendered_twice()
+    test.test_smart_replacement_body_lines_plain()
     print("🎉 All tests passed!")
\ No newline at end of file
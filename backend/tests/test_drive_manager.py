@@ -0,0 +1,243 @@
+import pytest
+import socket
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+# Add parent directory to path for imports when run directly
+if __name__ == "__main__":
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from backend.drive_manager import DriveManager
+
+
+TEMPLATES = [
+    {'id': 'senior', 'name': 'Senior Engineering Manager Resume'},
+    {'id': 'engineer', 'name': 'Engineer'},
+    {'id': 'manager', 'name': 'Engineering Manager'},
+    {'id': 'manager-copy', 'name': 'engineering manager'},
+]
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that runs each request and reports it to the callback."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except Exception as e:
+                self.callback(request_id, None, e)
+
+
+def http_error(status):
+    """An HttpError with the given status code."""
+    return HttpError(httplib2.Response({'status': status}), b'')
+
+
+class TestFindTemplateByName:
+    """Test template lookup by name without contacting Google Drive."""
+
+    @pytest.fixture
+    def manager(self):
+        """A DriveManager whose Drive service lists TEMPLATES in two pages."""
+        manager = DriveManager.__new__(DriveManager)
+        manager.config = Mock()
+        manager.config.get.side_effect = lambda key, default=None: default
+        manager._template_files = None
+        manager._load_settings()
+        manager.drive_service = Mock()
+        manager.drive_service.files.return_value.list.return_value.execute.side_effect = lambda: (
+            {'files': TEMPLATES[:2], 'nextPageToken': 'page-2'}
+            if manager.drive_service.files.return_value.list.call_count % 2 else
+            {'files': TEMPLATES[2:]}
+        )
+        return manager
+
+    def test_match_priority(self, manager):
+        """Test exact matches win over contained names, and the first template wins within a level."""
+        assert manager.find_template_by_name('ENGINEERING MANAGER') == 'manager'
+        assert manager.find_template_by_name('Senior Engineering') == 'senior'
+        assert manager.find_template_by_name('Staff Engineer II') == 'engineer'
+        assert manager.find_template_by_name('Designer') is None
+
+        print("✅ Template match priority preserved")
+
+    def test_listing_reused(self, manager):
+        """Test the paginated listing is fetched once and reused within the cache TTL."""
+        assert len(manager.list_template_files()) == len(TEMPLATES)
+        assert manager.find_template_by_name('Engineering Manager') == 'manager'
+
+        assert manager.drive_service.files.return_value.list.call_count == 2  # One listing, two pages
+
+        print("✅ Template listing paginated and reused")
+
+
+class TestAuthorizedHttp:
+    """Test the HTTP clients built for Google API calls."""
+
+    def test_disk_cache_opt_in(self, tmp_path):
+        """Test responses are only cached on disk when system.http_cache_dir is configured."""
+        manager = DriveManager.__new__(DriveManager)
+        manager._credentials = Mock()
+        manager.config = Mock()
+        settings = {}
+        manager.config.get.side_effect = lambda key, default=None: settings.get(key, default)
+
+        assert manager._authorized_http().http.cache is None
+
+        settings['system.http_cache_dir'] = str(tmp_path / 'http-cache')
+        assert manager._authorized_http().http.cache is not None
+
+        print("✅ HTTP disk cache only used when configured")
+
+
+class TestTemplateEndIndexes:
+    """Test copies are filled using template lengths that match the template's current version."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        """A DriveManager whose template text and Drive version can be changed between packages."""
+        manager = DriveManager.__new__(DriveManager)
+        manager.config = Mock()
+        manager.config.get.side_effect = lambda key, default=None: default
+        manager.config.get_file_organization_config.return_value = {'generate_pdf': False}
+        manager.config.get_template_mapping.return_value = {'engineering_manager': 'Engineering Manager'}
+        manager._template_end_index_cache = {}
+        manager._load_settings()
+
+        manager.template = {'version': '1', 'text': 'Template\n'}
+        manager.template_reads = []
+        manager.deleted_ranges = []
+
+        def copy_file(fileId, body, fields):
+            return Mock(execute=Mock(return_value={'id': f"copy-{len(manager.deleted_ranges)}"}))
+
+        def get_file(fileId, fields):
+            return Mock(execute=Mock(return_value={'version': manager.template['version']}))
+
+        def get_document(documentId, fields):
+            manager.template_reads.append(documentId)
+            content = [{'paragraph': {'elements': [{'textRun': {'content': manager.template['text']}}]}}]
+            return Mock(execute=Mock(return_value={'body': {'content': content}}))
+
+        def batch_update(documentId, body):
+            manager.deleted_ranges.append(body['requests'][0]['deleteContentRange']['range']['endIndex'])
+            return Mock(execute=Mock(return_value={}))
+
+        manager.drive_service = Mock()
+        manager.drive_service.new_batch_http_request.side_effect = FakeBatch
+        manager.drive_service.files.return_value.copy.side_effect = copy_file
+        manager.drive_service.files.return_value.get.side_effect = get_file
+        manager.docs_service = Mock()
+        manager.docs_service.new_batch_http_request.side_effect = FakeBatch
+        manager.docs_service.documents.return_value.get.side_effect = get_document
+        manager.docs_service.documents.return_value.batchUpdate.side_effect = batch_update
+
+        monkeypatch.setattr(manager, 'find_template_by_name', lambda name: 'template')
+        monkeypatch.setattr(manager, 'create_job_folder', lambda company, position: 'folder')
+        return manager
+
+    def create_package(self, manager):
+        """Create a package with only a resume and return the result."""
+        return manager._create_resume_package_by_copy('engineering_manager', 'Acme', 'EM', 'Resume text', '')
+
+    def test_end_index_follows_template_version(self, manager):
+        """Test an unchanged template reuses its end index and a grown or shrunk one is measured again."""
+        assert self.create_package(manager)['resume_id']
+        assert self.create_package(manager)['resume_id']
+        assert manager.deleted_ranges == [10, 10]
+        assert manager.template_reads == ['template']  # Second package reused the cached length
+
+        manager.template = {'version': '2', 'text': 'A much longer template\n'}
+        self.create_package(manager)
+        assert manager.deleted_ranges[-1] == 24
+
+        manager.template = {'version': '3', 'text': 'Short\n'}
+        self.create_package(manager)
+        assert manager.deleted_ranges[-1] == 7
+        assert len(manager.template_reads) == 3
+
+        print("✅ Template end index refreshed when the template changes")
+
+    def test_unknown_version_not_cached(self, manager):
+        """Test a template whose version cannot be read is measured for every package."""
+        version_request = Mock(execute=Mock(side_effect=Exception("version unavailable")))
+        manager.drive_service.files.return_value.get.side_effect = None
+        manager.drive_service.files.return_value.get.return_value = version_request
+
+        self.create_package(manager)
+        self.create_package(manager)
+
+        assert manager.deleted_ranges == [10, 10]
+        assert manager.template_reads == ['template', 'template']
+        assert manager._template_end_index_cache == {}
+
+        print("✅ Template end index not cached without a version")
+
+
+
+class TestExecuteBatch:
+    """Test which batched requests are sent again after a failure."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        """A DriveManager that does not sleep between retries."""
+        manager = DriveManager.__new__(DriveManager)
+        manager.config = Mock()
+        manager.config.get.side_effect = lambda key, default=None: default
+        manager._load_settings()
+        monkeypatch.setattr('backend.drive_manager.time.sleep', lambda seconds: None)
+        return manager
+
+    @staticmethod
+    def request(*outcomes):
+        """A request factory whose requests return or raise the given outcomes in turn."""
+        execute = Mock(side_effect=list(outcomes))
+        return Mock(return_value=Mock(execute=execute)), execute
+
+    def test_retryable_failures_resent(self, manager):
+        """Test requests the batch reports as retryable are resent alone and other failures are not."""
+        service = Mock()
+        service.new_batch_http_request.side_effect = FakeBatch
+        copy, copy_execute = self.request(http_error(503), {'id': 'copy'})
+        get, get_execute = self.request(http_error(404))
+        done, done_execute = self.request({'version': '1'})
+
+        responses = manager._execute_batch(service, {'copy': copy, 'get': get, 'done': done},
+                                           non_idempotent=['copy'])
+
+        assert responses == {'copy': {'id': 'copy'}, 'get': None, 'done': {'version': '1'}}
+        assert (copy_execute.call_count, get_execute.call_count, done_execute.call_count) == (2, 1, 1)
+
+        print("✅ Retryable batch failures resent individually")
+
+    @pytest.mark.parametrize('error', [socket.timeout('read timed out'), http_error(503)])
+    def test_failed_batch_not_repeated(self, manager, error):
+        """Test a failed batch is sent once and only its idempotent requests are sent again."""
+        service = Mock()
+        service.new_batch_http_request.return_value.execute.side_effect = error
+        copy, copy_execute = self.request({'id': 'copy'})
+        get, get_execute = self.request({'version': '1'})
+
+        responses = manager._execute_batch(service, {'copy': copy, 'get': get}, non_idempotent=['copy'])
+
+        assert responses == {'copy': None, 'get': {'version': '1'}}
+        assert service.new_batch_http_request.return_value.execute.call_count == 1
+        assert copy_execute.call_count == 0
+
+        print("✅ Failed batch not resent as a whole")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,120 @@
+import pytest
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports when run directly
+if __name__ == "__main__":
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from openpyxl import Workbook, load_workbook
+
+from backend.excel_tracker import ResumeTracker
+
+
+class TestResumeTracker:
+    """Test application records are written to and read from the tracking sheet."""
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        """Return a tracker pointing at a worksheet that does not exist yet."""
+        return ResumeTracker(str(tmp_path / 'tracking' / 'applications.xlsx'))
+
+    def test_records_inserted_newest_first(self, tracker):
+        """Test records stay newest first, backfilled dates included, and duplicates are skipped."""
+        assert tracker.add_application_record('Acme', 'Platform', 'Engineering Manager',
+                                              application_date=datetime(2024, 1, 5))
+        assert tracker.add_application_record('Globex', 'Data', 'Data Engineer', '$150,000',
+                                              application_date=datetime(2024, 2, 1),
+                                              application_page='https://globex.example/jobs/1')
+        assert tracker.add_application_record('ACME', 'Platform', 'engineering manager',
+                                              application_date=datetime(2024, 1, 5))
+        assert tracker.add_application_record('Initech', 'Apps', 'Staff Engineer',
+                                              application_date=datetime(2024, 1, 20))
+
+        rows = list(load_workbook(tracker.worksheet_path).active.iter_rows(values_only=True))
+
+        assert list(rows[0]) == ResumeTracker.REQUIRED_COLUMNS
+        assert [row[0] for row in rows[1:]] == ['Globex', 'Initech', 'Acme']
+        assert rows[1][4] == '2024-02-01'
+
+        print("✅ Records inserted newest first without duplicates")
+
+    def test_duplicates_and_stats(self, tracker):
+        """Test duplicate detection by URL or same-day role and the summary counts."""
+        today = datetime.now()
+        tracker.add_application_record('Acme', 'Platform', 'Engineering Manager',
+                                       application_date=datetime(2020, 3, 1),
+                                       application_page='https://acme.example/jobs/7')
+        tracker.add_application_record('Initech', 'Apps', 'Software Engineer', application_date=today)
+        tracker.add_application_record('Initech', 'Apps', 'Staff Engineer', application_date=today)
+
+        assert tracker.check_duplicate_resume('acme', 'engineering manager', 'HTTPS://ACME.example/jobs/7')
+        assert not tracker.check_duplicate_resume('Acme', 'Engineering Manager', 'https://acme.example/jobs/8')
+        assert tracker.check_duplicate_resume('Initech', 'Software Engineer')
+        assert tracker.check_duplicate_resume('Initech', 'Software Engineer', None)
+        assert not tracker.check_duplicate_resume('Initech', 'Engineering Manager')
+
+        stats = tracker.get_application_stats()
+        assert stats['total_applications'] == 3
+        assert stats['companies_applied'] == 2
+        assert stats['roles_applied'] == 3
+        assert stats['this_month_applications'] == 2
+
+        print("✅ Duplicates detected and stats counted")
+
+    def test_rows_cached_until_file_changes(self, tracker):
+        """Test repeated reads reuse the parsed rows and writes invalidate them."""
+        tracker.add_application_record('Acme', 'Platform', 'Engineering Manager')
+
+        rows = tracker._load_rows()
+        assert tracker._load_rows() is rows
+
+        tracker.add_application_record('Globex', 'Data', 'Data Engineer')
+        assert len(tracker._load_rows()) == 2
+
+        print("✅ Parsed rows cached until the worksheet changes")
+
+    def test_worksheet_verified_once(self, tracker, monkeypatch):
+        """Test the worksheet is verified once per tracker and re-created if it disappears."""
+        assert tracker.ensure_worksheet_exists()
+
+        def fail():
+            raise AssertionError("worksheet verified again")
+
+        monkeypatch.setattr(tracker, '_verify_headers', fail)
+        assert tracker.add_application_record('Acme', 'Platform', 'Engineering Manager')
+        assert tracker.check_duplicate_resume('Acme', 'Engineering Manager')
+
+        tracker.worksheet_path.unlink()
+        assert tracker.ensure_worksheet_exists()
+        assert tracker.worksheet_path.exists()
+
+        print("✅ Worksheet verified once per tracker")
+
+    @pytest.mark.parametrize('extra_sheet', [False, True])
+    def test_missing_columns_added(self, tracker, extra_sheet):
+        """Test a sheet missing a column is rewritten with every column and its other sheets kept."""
+        tracker.worksheet_path.parent.mkdir(parents=True)
+        wb = Workbook()
+        wb.active.append(['Company', 'Department', 'Role', 'Application Date', 'Application Page'])
+        wb.active.append(['Acme', 'Platform', 'Engineering Manager', '2024-01-05', 'https://acme.example'])
+        if extra_sheet:
+            wb.create_sheet('Notes').append(['keep me'])
+        wb.save(tracker.worksheet_path)
+
+        assert tracker.ensure_worksheet_exists()
+
+        wb = load_workbook(tracker.worksheet_path)
+        rows = list(wb.active.iter_rows(values_only=True))
+        assert list(rows[0]) == ResumeTracker.REQUIRED_COLUMNS
+        assert rows[1][:3] == ('Acme', 'Platform', 'Engineering Manager')
+        assert rows[1][4:] == ('2024-01-05', 'https://acme.example')
+        assert wb.active['A1'].font.bold
+        assert ('Notes' in wb.sheetnames) == extra_sheet
+
+        print("✅ Missing columns added to existing worksheet")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
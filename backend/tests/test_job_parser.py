@@ -0,0 +1,115 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports when run directly
+if __name__ == "__main__":
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from backend import job_parser
+from backend.job_parser import JobParser
+
+
+class TestJobParser:
+    """Test position and company extraction from job description text."""
+
+    def test_position_pattern_priority(self):
+        """Test the first listed position pattern wins and keeps the text's casing."""
+        text = "Lead Software Engineer wanted. You will mentor every SENIOR SOFTWARE ENGINEER on the team."
+
+        assert JobParser._extract_position_title(text) == "SENIOR SOFTWARE ENGINEER"
+        assert JobParser._extract_position_title("We are hiring a lead software engineer") == "software engineer"
+        assert JobParser._extract_position_title("Position: Head of Growth") == "Head of Growth"
+
+        print("✅ Position patterns matched in priority order")
+
+    def test_select_resume_template(self):
+        """Test template selection follows the category priority order."""
+        assert JobParser.select_resume_template("Senior Engineering Manager, Payments") == 'senior_engineering_manager'
+        assert JobParser.select_resume_template("Manager, Data Engineering") == 'data_engineering_manager'
+        assert JobParser.select_resume_template("Manager 1, Software Development") == 'engineering_manager'
+        assert JobParser.select_resume_template("Staff Engineer") == 'senior_software_engineer'
+        assert JobParser.select_resume_template("Frontend Developer") == 'senior_software_engineer'
+        assert JobParser.select_resume_template("Product Designer") is None
+
+        print("✅ Resume templates selected by priority")
+
+    def test_company_search_window(self):
+        """Test company mentions are only searched near the start of long descriptions."""
+        filler = "lorem ipsum dolor sit amet " * 20
+
+        assert JobParser._extract_company_name(filler + "Work at Initech today") == "Initech today"
+        assert JobParser._extract_company_name(filler * 10 + "Work at Initech today") is None
+
+        print("✅ Company search bounded to the leading window")
+
+    def test_html_to_text_regex_fallback(self, monkeypatch):
+        """Test tags are dropped and whitespace collapsed when selectolax is unavailable."""
+        monkeypatch.setattr(job_parser, 'HTMLParser', None)
+
+        assert job_parser._html_to_text("<p>Acme &amp; Co</p>\n<p>is   hiring</p>") == "Acme &amp; Co is hiring"
+
+        print("✅ HTML stripped with the regex fallback")
+
+    def test_html_to_text_selectolax(self, monkeypatch):
+        """Test the selectolax backend decodes entities and joins text across inline tags like the regex."""
+        pytest.importorskip('selectolax.lexbor')
+        assert job_parser.HTMLParser is not None
+
+        html = "<html><body><p>Acme &amp; Co</p>\n<p>is   hiring</p> <b>Staff</b><i>Engineer</i></body></html>"
+        assert job_parser._html_to_text(html) == "Acme & Co is hiring StaffEngineer"
+        assert job_parser._html_to_text("Pay: $<span>150</span>K - $<span>200</span>K") == "Pay: $150K - $200K"
+        assert job_parser._html_to_text("") == ""
+
+        postings = ["Pay: $<span>150</span>K - $<span>200</span>K", "Range: <em>$140</em>k-<em>$180</em>k",
+                    "Salary $120,000&ndash;$160,000"]
+        salaries = [JobParser.extract_salary(posting) for posting in postings]
+        assert salaries[:2] == ["$150,000 - $200,000", "$140,000 - $180,000"]
+
+        # Salaries must not depend on which HTML backend is installed
+        monkeypatch.setattr(job_parser, 'HTMLParser', None)
+        assert [JobParser.extract_salary(posting) for posting in postings] == salaries
+
+        print("✅ HTML stripped with selectolax")
+
+    def test_parse_job_posting_cached(self, monkeypatch):
+        """Test an identical posting is parsed once and callers get independent results."""
+        job_description = "<title>Software Engineer at Hooli | Careers</title> Pay: $150K - $200K"
+        first = JobParser.parse_job_posting(job_description, "https://hooli.example/jobs/1")
+        first['company_name'] = 'Changed'
+
+        def fail(*args, **kwargs):
+            raise AssertionError("posting parsed again")
+
+        monkeypatch.setattr(JobParser, '_parse_job_posting', fail)
+        second = JobParser.parse_job_posting(job_description, "https://hooli.example/jobs/1")
+
+        assert second['company_name'] == 'Hooli'
+        assert second['position_title'] == 'Software Engineer'
+        assert second['salary'] == '$150,000 - $200,000'
+
+        print("✅ Repeat postings served from the parse cache")
+
+    def test_failed_spa_salary_lookup_not_cached(self, monkeypatch):
+        """Test a SPA posting whose salary lookup found nothing is parsed again on retry."""
+        job_description = '<html><body><div id="__nuxt"></div></body></html>'
+        url = "https://careers.example/jobs/engineering-manager/"
+        lookups = []
+
+        def no_salary(html_content, url=None):
+            lookups.append(url)
+            return None
+
+        monkeypatch.setattr(JobParser, '_extract_salary_from_spa', no_salary)
+        first = JobParser.parse_job_posting(job_description, url)
+        second = JobParser.parse_job_posting(job_description, url)
+
+        assert first['salary'] == second['salary'] == "TBD"
+        assert second['position_title'] == "Engineering Manager"
+        assert len(lookups) == 2
+
+        print("✅ Failed SPA salary lookups retried")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])